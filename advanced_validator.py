@@ -13,6 +13,16 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import defaultdict
 
+# Poids selon le nombre de boules/étoiles correctes
+_MATCH_WEIGHTS = {
+    5: 100,    # 5 boules = jackpot
+    4: 20,     # 4 boules
+    3: 5,      # 3 boules
+    2: 2,      # 2 boules
+    1: 1,      # 1 boule
+    0: 0       # Aucune
+}
+
 class AdvancedValidator:
     """Validateur avancé pour les prédictions EuroMillions."""
     
@@ -196,15 +206,7 @@ class AdvancedValidator:
     def calculate_weighted_accuracy(self, predictions: List[Dict], actual_draws: List[Dict]) -> float:
         """Calculer la précision pondérée selon la difficulté."""
         
-        # Poids selon le nombre de boules/étoiles correctes
-        weights = {
-            5: 100,    # 5 boules = jackpot
-            4: 20,     # 4 boules
-            3: 5,      # 3 boules
-            2: 2,      # 2 boules
-            1: 1,      # 1 boule
-            0: 0       # Aucune
-        }
+        weights = _MATCH_WEIGHTS
         
         total_weighted_score = 0
         total_max_possible = 0
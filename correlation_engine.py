@@ -5,10 +5,11 @@ Module de corrélation multi-sources: combine toutes les données externes et an
 import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from scipy.stats import pearsonr, spearmanr
@@ -31,6 +32,15 @@ except ImportError as e:
     logger.warning(f"Collecteurs non disponibles: {e}")
     COLLECTORS_AVAILABLE = False
 
+# Métriques extraites de collect_enriched_draw_data, une colonne chacune
+_ENRICHED_METRICS = [
+    'sum_numbers', 'sum_stars',
+    'moon_phase_pct', 'moon_illumination', 'moon_age_days',
+    'temperature_c', 'humidity_pct', 'pressure_hpa', 'wind_speed_kmh',
+    'kp_index', 'earthquake_count',
+    'prime_count', 'fibonacci_count', 'even_count'
+]
+
 
 class MultiSourceCorrelator:
     """
@@ -179,21 +189,8 @@ class MultiSourceCorrelator:
                     'n1': row['n1'], 'n2': row['n2'], 'n3': row['n3'],
                     'n4': row['n4'], 'n5': row['n5'],
                     's1': row['s1'], 's2': row['s2'],
-                    'sum_numbers': enriched.get('sum_numbers'),
-                    'sum_stars': enriched.get('sum_stars'),
-                    'moon_phase_pct': enriched.get('moon_phase_pct'),
-                    'moon_illumination': enriched.get('moon_illumination'),
-                    'moon_age_days': enriched.get('moon_age_days'),
-                    'temperature_c': enriched.get('temperature_c'),
-                    'humidity_pct': enriched.get('humidity_pct'),
-                    'pressure_hpa': enriched.get('pressure_hpa'),
-                    'wind_speed_kmh': enriched.get('wind_speed_kmh'),
-                    'kp_index': enriched.get('kp_index'),
-                    'earthquake_count': enriched.get('earthquake_count'),
-                    'prime_count': enriched.get('prime_count'),
-                    'fibonacci_count': enriched.get('fibonacci_count'),
-                    'even_count': enriched.get('even_count')
                 }
+                flat_row.update((key, enriched.get(key)) for key in _ENRICHED_METRICS)
                 
                 enriched_rows.append(flat_row)
                 
@@ -206,6 +203,74 @@ class MultiSourceCorrelator:
                 continue
         
         enriched_df = pd.DataFrame(enriched_rows)
+        return self._save_enriched_dataset(enriched_df)
+    
+    def build_enriched_dataset_batch(self, draws_df: pd.DataFrame, max_workers: int = 8) -> pd.DataFrame:
+        """
+        Variante de build_enriched_dataset qui collecte les tirages en parallèle.
+        
+        Les dates et numéros sont préparés en colonnes, puis les collectes
+        (appels HTTP bloquants) sont réparties sur un pool de threads: leurs
+        temps d'attente réseau se recouvrent au lieu de s'additionner. Comme
+        dans build_enriched_dataset, un tirage en erreur est journalisé puis
+        ignoré au lieu d'interrompre la construction.
+        
+        Args:
+            draws_df: DataFrame avec les tirages (draw_date, n1-n5, s1-s2)
+            max_workers: Nombre de tirages collectés simultanément
+            
+        Returns:
+            DataFrame enrichi avec colonnes supplémentaires
+        """
+        logger.info(f"Construction du dataset enrichi pour {len(draws_df)} tirages ({max_workers} threads)")
+        
+        # Assumer 21h05 si pas d'heure
+        draw_dates = pd.to_datetime(draws_df['draw_date'], errors='coerce').reset_index(drop=True)
+        at_midnight = (draw_dates.dt.hour == 0) & (draw_dates.dt.minute == 0)
+        draw_dates = draw_dates.mask(at_midnight, draw_dates + pd.Timedelta(hours=21, minutes=5))
+        
+        draws = draws_df[['n1', 'n2', 'n3', 'n4', 'n5', 's1', 's2']].reset_index(drop=True)
+        
+        # Tirages sans date ou avec un numéro manquant (NULL en base): ignorés
+        usable = (draws.notna().all(axis=1) & draw_dates.notna()).to_numpy()
+        for idx in draws_df.index[~usable]:
+            logger.error(f"Erreur traitement tirage {idx}: date ou numéros manquants")
+        
+        numbers = draws.loc[usable, ['n1', 'n2', 'n3', 'n4', 'n5']].to_numpy(dtype=int).tolist()
+        stars = draws.loc[usable, ['s1', 's2']].to_numpy(dtype=int).tolist()
+        dates = draw_dates[usable].tolist()
+        
+        # map conserve l'ordre des tirages
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            enriched_list = list(executor.map(
+                self._collect_enriched_draw_data_or_none,
+                draws_df.index[usable], dates, numbers, stars
+            ))
+        
+        collected = np.array([enriched is not None for enriched in enriched_list], dtype=bool)
+        kept = np.flatnonzero(usable)[collected]
+        
+        enriched_df = pd.DataFrame(
+            [[enriched.get(key) for key in _ENRICHED_METRICS]
+             for enriched in enriched_list if enriched is not None],
+            columns=_ENRICHED_METRICS
+        )
+        enriched_df = pd.concat([draws.iloc[kept].reset_index(drop=True), enriched_df], axis=1)
+        enriched_df.insert(0, 'draw_date', draw_dates.iloc[kept].reset_index(drop=True))
+        
+        return self._save_enriched_dataset(enriched_df)
+    
+    def _collect_enriched_draw_data_or_none(self, idx: Any, draw_date: datetime,
+                                            numbers: List[int], stars: List[int]) -> Optional[Dict[str, Any]]:
+        """Collecte les données d'un tirage, ou journalise l'erreur et renvoie None."""
+        try:
+            return self.collect_enriched_draw_data(draw_date, numbers, stars)
+        except Exception as e:
+            logger.error(f"Erreur traitement tirage {idx}: {e}")
+            return None
+    
+    def _save_enriched_dataset(self, enriched_df: pd.DataFrame) -> pd.DataFrame:
+        """Sauvegarde le dataset enrichi dans le cache et le renvoie."""
         logger.info(f"✓ Dataset enrichi créé: {len(enriched_df)} lignes, {len(enriched_df.columns)} colonnes")
         
         # Sauvegarder
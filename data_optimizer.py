@@ -13,6 +13,10 @@ from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
+# Numéros possibles, réutilisés à chaque tirage synthétique
+_BALLS_POOL = np.arange(1, 51)
+_STARS_POOL = np.arange(1, 13)
+
 class DataOptimizer:
     """Optimiseur pour améliorer les données d'entraînement."""
     
@@ -578,14 +582,14 @@ class DataOptimizer:
         ball_probs = np.array([patterns['ball_frequencies'].get(i, 0.02) for i in range(1, 51)])
         ball_probs = ball_probs / np.sum(ball_probs)
         
-        synthetic_balls = np.random.choice(range(1, 51), size=5, replace=False, p=ball_probs)
+        synthetic_balls = np.random.choice(_BALLS_POOL, size=5, replace=False, p=ball_probs)
         synthetic_balls.sort()
         
         # Générer des étoiles
         star_probs = np.array([patterns['star_frequencies'].get(i, 0.083) for i in range(1, 13)])
         star_probs = star_probs / np.sum(star_probs)
         
-        synthetic_stars = np.random.choice(range(1, 13), size=2, replace=False, p=star_probs)
+        synthetic_stars = np.random.choice(_STARS_POOL, size=2, replace=False, p=star_probs)
         synthetic_stars.sort()
         
         return {
@@ -210,6 +210,10 @@ class HybridPredictionStrategy:
         sorted_balls = sorted(ball_scores.items(), key=lambda x: x[1], reverse=True)
         sorted_stars = sorted(star_scores.items(), key=lambda x: x[1], reverse=True)
         
+        # Tables de scores indexées par numéro, construites une seule fois
+        ball_lookup = self.build_score_lookup(ball_scores, 50)
+        star_lookup = self.build_score_lookup(star_scores, 12)
+        
         for i in range(n):
             if i < n // 3:
                 # Stratégie 1: Top scores purs
@@ -223,7 +227,7 @@ class HybridPredictionStrategy:
             
             # Ajouter métadonnées
             combo['strategy'] = f"hybrid_{i+1}"
-            combo['confidence'] = self.calculate_confidence_score(combo, ball_scores, star_scores)
+            combo['confidence'] = self.calculate_confidence_score(combo, ball_lookup, star_lookup)
             combo['generated_at'] = datetime.now().isoformat()
             
             combinations.append(combo)
@@ -300,26 +304,38 @@ class HybridPredictionStrategy:
         
         selected_balls = np.random.choice(ball_numbers, 5, replace=False, p=ball_probs)
         selected_stars = np.random.choice(star_numbers, 2, replace=False, p=star_probs)
+        selected_balls.sort()
+        selected_stars.sort()
         
         return {
-            'balls': sorted(selected_balls.tolist()),
-            'stars': sorted(selected_stars.tolist()),
+            'balls': selected_balls.tolist(),
+            'stars': selected_stars.tolist(),
             'method': 'probabilistic'
         }
     
-    def calculate_confidence_score(self, combo: Dict, ball_scores: Dict, star_scores: Dict) -> float:
-        """Calculer un score de confiance pour la combinaison."""
+    @staticmethod
+    def build_score_lookup(scores: Dict, max_number: int) -> np.ndarray:
+        """Construire un tableau de scores indexé par numéro (0 si absent)."""
+        lookup = np.zeros(max_number + 1)
+        if scores:
+            lookup[np.fromiter(scores.keys(), dtype=np.int64, count=len(scores))] = \
+                np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+        return lookup
+    
+    def calculate_confidence_score(self, combo: Dict, ball_lookup: np.ndarray,
+                                   star_lookup: np.ndarray) -> float:
+        """Calculer un score de confiance pour la combinaison (voir build_score_lookup)."""
         
         # Score moyen des boules sélectionnées
-        ball_avg = np.mean([ball_scores.get(ball, 0) for ball in combo['balls']])
+        ball_avg = ball_lookup[combo['balls']].mean()
         
         # Score moyen des étoiles sélectionnées
-        star_avg = np.mean([star_scores.get(star, 0) for star in combo['stars']])
+        star_avg = star_lookup[combo['stars']].mean()
         
         # Score de confiance combiné
         confidence = (ball_avg * 0.7 + star_avg * 0.3) * 100
         
-        return round(confidence, 2)
+        return round(float(confidence), 2)
     
     # Méthodes utilitaires
     def calculate_ball_frequency(self, df: pd.DataFrame, ball_num: int) -> float:
@@ -2,22 +2,203 @@
 SQLite repository for Euromillions draw data.
 Handles database operations with automatic schema creation and data management.
 """
+import os
 import sqlite3
 import json
+import threading
+import weakref
+from datetime import date
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, ClassVar, Iterator, Tuple, Union
 from contextlib import contextmanager
+import numpy as np
 import pandas as pd
 from config import get_settings
 
+# Optional fast JSON codec
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional compression for stored raw HTML
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+_ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+# Stay below SQLITE_MAX_VARIABLE_NUMBER (999 on older SQLite builds)
+_MAX_SQL_PARAMS = 900
+
+# Rows written per upsert transaction before checkpointing the WAL
+_UPSERT_CHUNK_SIZE = 2000
+
+# Fields every draw passed to upsert_draws must provide
+_REQUIRED_DRAW_FIELDS = frozenset(("draw_id", "draw_date", "n1", "n2", "n3", "n4", "n5", "s1", "s2"))
+
+# Accepted value range of each number field
+_NUMBER_FIELD_RANGES = (
+    ("n1", 1, 50), ("n2", 1, 50), ("n3", 1, 50), ("n4", 1, 50), ("n5", 1, 50),
+    ("s1", 1, 12), ("s2", 1, 12),
+)
+
+# Stored in PRAGMA user_version once a database file has the current schema;
+# bump it whenever _create_tables_if_missing/_migrate_schema change
+_SCHEMA_VERSION = 2
+
+# Size of the per-connection prepared statement cache
+_STATEMENT_CACHE_SIZE = 256
+
+# draw_date_i stores dates as days since the Unix epoch
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Hot queries kept as constants so the statement cache always sees identical text
+_SQL_SET_META = "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)"
+
+_SQL_EXISTING_IDS = "SELECT draw_id FROM draws WHERE draw_id IN ({placeholders})"
+
+# ON CONFLICT updates the existing row in place instead of the delete +
+# reinsert done by INSERT OR REPLACE
+_SQL_UPSERT = """
+    INSERT INTO draws 
+    (draw_id, draw_date, draw_date_i, n1, n2, n3, n4, n5, s1, s2, 
+     jackpot, prize_table_json, raw_html)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(draw_id) DO UPDATE SET
+        draw_date = excluded.draw_date,
+        draw_date_i = excluded.draw_date_i,
+        n1 = excluded.n1,
+        n2 = excluded.n2,
+        n3 = excluded.n3,
+        n4 = excluded.n4,
+        n5 = excluded.n5,
+        s1 = excluded.s1,
+        s2 = excluded.s2,
+        jackpot = excluded.jackpot,
+        prize_table_json = excluded.prize_table_json,
+        raw_html = excluded.raw_html
+"""
+
+_SQL_DELETE_ALL_DRAWS = "DELETE FROM draws"
+
+# Rows written outside the repository may lack draw_date_i; derive it in SQL
+_SQL_EPOCH_DAY = "CAST(julianday(draw_date) - 2440587.5 AS INTEGER)"
+
+_SQL_ALL_DRAWS_TEMPLATE = f"""
+    SELECT draw_id, COALESCE(draw_date_i, {_SQL_EPOCH_DAY}) AS draw_date_i,
+           n1, n2, n3, n4, n5, s1, s2,
+           jackpot{{blob_columns}}
+    FROM draws 
+    WHERE draw_date_i IS NOT NULL OR date(draw_date) = draw_date
+    ORDER BY draw_date ASC
+"""
+
+# Prize tables and raw HTML dominate row size and are rarely needed,
+# so they are only read on request
+_SQL_ALL_DRAWS = _SQL_ALL_DRAWS_TEMPLATE.format(blob_columns="")
+_SQL_ALL_DRAWS_WITH_BLOBS = _SQL_ALL_DRAWS_TEMPLATE.format(
+    blob_columns=", prize_table_json, raw_html"
+)
+
+# Ball/star columns fit comfortably in int16 (int8 would overflow on sums).
+# A column holding a NULL or non-integer value (written outside the
+# repository) is read as float64 with NaN there instead.
+_NUMBER_COLUMNS = ("n1", "n2", "n3", "n4", "n5", "s1", "s2")
+_NUMBER_DTYPE = np.int16
+
+# Date parsing for pandas-based reads, matching all_draws_df()
+_READ_PARSE_DATES = {"draw_date": "%Y-%m-%d"}
+
+_SQL_LATEST_DATE = "SELECT MAX(draw_date) AS draw_date FROM draws"
+
+_SQL_GET_BY_ID = """
+    SELECT draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2,
+           jackpot, prize_table_json, raw_html
+    FROM draws 
+    WHERE draw_id = ?
+"""
+
+_SQL_COUNT = "SELECT COUNT(*) as count FROM draws"
+
+_SQL_DRAWS_PAGE_COLUMNS = """
+    SELECT draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2, jackpot
+    FROM draws 
+    WHERE date(draw_date) = draw_date
+"""
+
+_SQL_ITER_DRAWS = _SQL_DRAWS_PAGE_COLUMNS + "ORDER BY draw_date ASC"
+
+_SQL_RECENT_DRAWS = _SQL_DRAWS_PAGE_COLUMNS + "ORDER BY draw_date DESC LIMIT ?"
+
+_SQL_DATE_RANGE = """
+    SELECT MIN(draw_date) as earliest, MAX(draw_date) as latest 
+    FROM draws
+"""
+
+# Aggregates cached in the meta table; triggers drop them on any draws change
+_META_TOTAL_DRAWS = "stats_total_draws"
+_META_EARLIEST_DRAW = "stats_earliest_draw"
+_META_LATEST_DRAW = "stats_latest_draw"
+_META_STATS_KEYS = (_META_TOTAL_DRAWS, _META_EARLIEST_DRAW, _META_LATEST_DRAW)
+
+_SQL_GET_META = "SELECT value FROM meta WHERE key = ?"
+
+_SQL_GET_STATS_META = "SELECT key, value FROM meta WHERE key IN (?, ?, ?)"
+
+_STATS_INVALIDATION_TRIGGERS = {
+    "trg_draws_stats_insert": "AFTER INSERT ON draws",
+    "trg_draws_stats_update": "AFTER UPDATE ON draws",
+    "trg_draws_stats_delete": "AFTER DELETE ON draws",
+}
+
+_SQL_BACKFILL_DATE_I = f"""
+    UPDATE draws
+    SET draw_date_i = {_SQL_EPOCH_DAY}
+    WHERE draw_date_i IS NULL AND date(draw_date) = draw_date
+"""
+
+# Undo the former move of prize tables into prize_table_blob (same bytes, no
+# saving); the column is left in place, unused, on databases that have it
+_SQL_RESTORE_PRIZE_TABLE_TEXT = """
+    UPDATE draws
+    SET prize_table_json = CAST(prize_table_blob AS TEXT),
+        prize_table_blob = NULL
+    WHERE prize_table_json IS NULL AND prize_table_blob IS NOT NULL
+"""
+
 
 class EuromillionsRepository:
     """Repository for managing Euromillions draw data in SQLite."""
     
+    # Per-connection tuning applied right after connect
+    _CONNECTION_PRAGMAS: ClassVar[tuple] = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",      # 64 MB page cache
+        "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped I/O
+        "PRAGMA busy_timeout=5000",
+    )
+    
     def __init__(self):
         """Initialize repository with settings."""
         self.settings = get_settings()
         self._db_path = self._extract_db_path()
+        self._db_path_str = str(self._db_path)
+        
+        # Bumped on every write so cached file-size lookups can be reused
+        self._write_version = 0
+        self._db_size_cache: Optional[Tuple[int, int]] = None
+        
+        # Long-lived connection shared by all repository calls
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._finalizer: Optional[weakref.finalize] = None
     
     def _extract_db_path(self) -> Path:
         """Extract database file path from DB_URL."""
@@ -37,23 +218,67 @@ class EuromillionsRepository:
     @contextmanager
     def _connect(self):
         """
-        Create database connection and ensure schema exists.
+        Get the persistent database connection, opening it on first use.
+        
+        The connection is created once with check_same_thread=False and
+        guarded by a re-entrant lock, so calls from several threads are
+        serialized instead of each opening their own connection.
         
         Yields:
             sqlite3.Connection: Database connection with row factory
         """
-        # Ensure parent directory exists
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row  # Enable column access by name
+        with self._lock:
+            if self._conn is None:
+                # Ensure parent directory exists
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                conn = sqlite3.connect(
+                    self._db_path_str,
+                    check_same_thread=False,
+                    cached_statements=_STATEMENT_CACHE_SIZE
+                )
+                conn.row_factory = sqlite3.Row  # Enable column access by name
+                self._apply_pragmas(conn)
+                self._conn = conn
+                # Close the connection when the repository is collected or at exit
+                self._finalizer = weakref.finalize(self, conn.close)
+                
+                # The schema version lives in the file itself, so a database
+                # deleted and recreated (e.g. by train_modern) is migrated again
+                if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                    self._initialize_database_file(conn)
+            
+            try:
+                yield self._conn
+            except Exception:
+                # Never leave a half-finished transaction on the shared connection
+                if self._conn.in_transaction:
+                    self._conn.rollback()
+                raise
+    
+    def close(self) -> None:
+        """Close the persistent database connection."""
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+                self._finalizer = None
+            self._conn = None
+    
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Tune the connection for bulk I/O."""
+        for pragma in self._CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+    
+    def _initialize_database_file(self, conn: sqlite3.Connection) -> None:
+        """
+        Switch the file to WAL, create/migrate the schema and stamp its version.
         
-        try:
-            # Create tables if they don't exist
-            self._create_tables_if_missing(conn)
-            yield conn
-        finally:
-            conn.close()
+        Journal mode and user_version are both persistent in the database
+        file, so this only runs for files not yet at _SCHEMA_VERSION.
+        """
+        conn.execute("PRAGMA journal_mode=WAL")
+        self._create_tables_if_missing(conn)
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
     
     def _create_tables_if_missing(self, conn: sqlite3.Connection) -> None:
         """Create database tables if they don't exist."""
@@ -64,6 +289,7 @@ class EuromillionsRepository:
             CREATE TABLE IF NOT EXISTS draws (
                 draw_id TEXT PRIMARY KEY,
                 draw_date TEXT,
+                draw_date_i INTEGER,
                 n1 INTEGER,
                 n2 INTEGER,
                 n3 INTEGER,
@@ -73,7 +299,7 @@ class EuromillionsRepository:
                 s2 INTEGER,
                 jackpot REAL,
                 prize_table_json TEXT,
-                raw_html TEXT
+                raw_html BLOB
             )
         """)
         
@@ -87,9 +313,35 @@ class EuromillionsRepository:
         
         # Create indexes for better performance
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_draws_date ON draws(draw_date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_draws_numbers ON draws(n1, n2, n3, n4, n5)")
         
-        conn.commit()
+        # Invalidate cached stats whenever draws change, whoever writes them
+        stats_keys = ", ".join(f"'{key}'" for key in _META_STATS_KEYS)
+        for name, event in _STATS_INVALIDATION_TRIGGERS.items():
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {name} {event}
+                BEGIN
+                    DELETE FROM meta WHERE key IN ({stats_keys});
+                END
+            """)
+        
+        # DDL runs outside implicit transactions, so no commit is needed here
+        self._migrate_schema(conn)
+    
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """Bring databases created by older versions up to the current schema."""
+        # No query filters on the ball columns; the index only slowed down writes
+        conn.execute("DROP INDEX IF EXISTS idx_draws_numbers")
+        
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(draws)")}
+        
+        if "prize_table_blob" in columns:
+            conn.execute(_SQL_RESTORE_PRIZE_TABLE_TEXT)
+            conn.commit()
+        
+        if "draw_date_i" not in columns:
+            conn.execute("ALTER TABLE draws ADD COLUMN draw_date_i INTEGER")
+            conn.execute(_SQL_BACKFILL_DATE_I)
+            conn.commit()
     
     def init_db(self) -> None:
         """
@@ -101,17 +353,63 @@ class EuromillionsRepository:
             cursor = conn.cursor()
             
             # Set database version and creation timestamp
+            cursor.execute(_SQL_SET_META, ("db_version", "1.0"))
             cursor.execute(
-                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
-                ("db_version", "1.0")
-            )
-            cursor.execute(
-                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                _SQL_SET_META,
                 ("created_at", pd.Timestamp.now().isoformat())
             )
             
             conn.commit()
     
+    def _draws_to_rows(self, draws: List[Dict[str, Any]]) -> Tuple[List[tuple], int]:
+        """
+        Convert draw dictionaries into positional rows for _SQL_UPSERT.
+        
+        Draws with a missing field, a number that is not an integer within
+        its range, or a draw_date that is not a valid date are skipped.
+        
+        Args:
+            draws: List of draw dictionaries
+            
+        Returns:
+            Tuple of (rows, number of draws skipped as invalid)
+        """
+        rows = []
+        invalid = []
+        compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL) if ZSTD_AVAILABLE else None
+        
+        for draw in draws:
+            problem = _draw_problem(draw)
+            if problem is not None:
+                invalid.append(f"{draw.get('draw_id', 'unknown')} ({problem})")
+                continue
+            
+            draw_date = _normalize_draw_date(draw["draw_date"])
+            
+            # Positional row matching the INSERT column order; numpy integers
+            # are stored as plain ints (sqlite3 would write them as BLOBs)
+            rows.append((
+                draw["draw_id"],
+                draw_date,
+                _epoch_day(draw_date),
+                int(draw["n1"]),
+                int(draw["n2"]),
+                int(draw["n3"]),
+                int(draw["n4"]),
+                int(draw["n5"]),
+                int(draw["s1"]),
+                int(draw["s2"]),
+                draw.get("jackpot"),
+                encode_prize_table(prize_table) if (prize_table := draw.get("prize_table")) else None,
+                compress_html(draw.get("raw_html"), compressor)
+            ))
+        
+        errors = len(invalid)
+        if invalid:
+            print(f"Skipped {errors} invalid draw(s): {', '.join(invalid)}")
+        
+        return rows, errors
+    
     def upsert_draws(self, draws: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         Insert or update draw records.
@@ -125,118 +423,190 @@ class EuromillionsRepository:
         if not draws:
             return {"inserted": 0, "updated": 0, "errors": 0}
         
-        inserted = 0
-        updated = 0
-        errors = 0
+        rows, errors = self._draws_to_rows(draws)
+        
+        if not rows:
+            return {"inserted": 0, "updated": 0, "errors": errors}
         
         with self._connect() as conn:
             cursor = conn.cursor()
             
-            for draw in draws:
-                try:
-                    # Check if draw already exists
-                    cursor.execute(
-                        "SELECT draw_id FROM draws WHERE draw_id = ?",
-                        (draw["draw_id"],)
-                    )
-                    exists = cursor.fetchone() is not None
-                    
-                    # Prepare data with proper JSON serialization
-                    # Ensure draw_date is in string format
-                    draw_date = draw["draw_date"]
-                    if hasattr(draw_date, 'strftime'):
-                        draw_date = draw_date.strftime('%Y-%m-%d')
-                    elif isinstance(draw_date, str) and len(draw_date) > 10:
-                        # Handle datetime strings that might include time
-                        draw_date = draw_date[:10]
-                    
-                    draw_data = {
-                        "draw_id": draw["draw_id"],
-                        "draw_date": draw_date,
-                        "n1": draw["n1"],
-                        "n2": draw["n2"], 
-                        "n3": draw["n3"],
-                        "n4": draw["n4"],
-                        "n5": draw["n5"],
-                        "s1": draw["s1"],
-                        "s2": draw["s2"],
-                        "jackpot": draw.get("jackpot"),
-                        "prize_table_json": json.dumps(draw.get("prize_table")) if draw.get("prize_table") else None,
-                        "raw_html": draw.get("raw_html")
-                    }
-                    
-                    # Insert or replace record
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO draws 
-                        (draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2, 
-                         jackpot, prize_table_json, raw_html)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, tuple(draw_data.values()))
-                    
-                    if exists:
-                        updated += 1
-                    else:
-                        inserted += 1
-                        
-                except Exception as e:
-                    errors += 1
-                    print(f"Error processing draw {draw.get('draw_id', 'unknown')}: {e}")
+            # Find which draws already exist with one query per parameter chunk
+            draw_ids = list({row[0] for row in rows})
+            existing = set()
+            for i in range(0, len(draw_ids), _MAX_SQL_PARAMS):
+                chunk = draw_ids[i:i + _MAX_SQL_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(_SQL_EXISTING_IDS.format(placeholders=placeholders), chunk)
+                existing.update(r[0] for r in cursor.fetchall())
             
-            conn.commit()
+            # One transaction per chunk keeps the WAL bounded on large backfills
+            for i in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+                conn.execute("BEGIN IMMEDIATE")
+                cursor.executemany(_SQL_UPSERT, rows[i:i + _UPSERT_CHUNK_SIZE])
+                conn.commit()
+                if i + _UPSERT_CHUNK_SIZE < len(rows):
+                    conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            
+            self._write_version += 1
+        
+        inserted = len(draw_ids) - len(existing)
+        updated = len(rows) - inserted
         
         return {"inserted": inserted, "updated": updated, "errors": errors}
     
-    def all_draws_df(self) -> pd.DataFrame:
+    def reset_and_load(self, draws: List[Dict[str, Any]]) -> Dict[str, int]:
         """
-        Get all draws as a pandas DataFrame ordered by draw_date ASC.
+        Replace every stored draw with the given ones in a single transaction.
         
+        Either the delete and all inserts are committed together, or nothing
+        changes.
+        
+        Args:
+            draws: List of draw dictionaries with required fields
+            
         Returns:
-            pd.DataFrame: All draw data with parsed prize_table_json
+            Dict with counts: {"deleted": int, "inserted": int, "errors": int}
         """
+        rows, errors = self._draws_to_rows(draws)
+        
         with self._connect() as conn:
-            # Query all draws ordered by date
-            df = pd.read_sql_query("""
-                SELECT draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2,
-                       jackpot, prize_table_json, raw_html
-                FROM draws 
-                ORDER BY draw_date ASC
-            """, conn)
+            cursor = conn.cursor()
             
-            if df.empty:
-                return df
+            conn.execute("BEGIN IMMEDIATE")
+            cursor.execute(_SQL_DELETE_ALL_DRAWS)
+            deleted = cursor.rowcount
+            cursor.executemany(_SQL_UPSERT, rows)
+            conn.commit()
             
-            # Parse prize_table_json back to Python objects
-            df["prize_table"] = df["prize_table_json"].apply(
-                lambda x: json.loads(x) if x else None
+            self._write_version += 1
+        
+        return {
+            "deleted": deleted,
+            "inserted": len({row[0] for row in rows}),
+            "errors": errors
+        }
+    
+    def all_draws_df(self, include_blobs: bool = False) -> pd.DataFrame:
+        """
+        Get all draws as a pandas DataFrame ordered by draw_date ASC.
+        
+        Columns are built directly from typed NumPy arrays. Rows whose
+        draw_date is not a valid YYYY-MM-DD date are skipped. By default only
+        the id, date, numbers and jackpot are read.
+        
+        Args:
+            include_blobs: Also read prize_table_json (raw JSON text, see
+                parse_prize_tables) and the decompressed raw_html
+        
+        Returns:
+            pd.DataFrame: All draw data
+        """
+        sql = _SQL_ALL_DRAWS_WITH_BLOBS if include_blobs else _SQL_ALL_DRAWS
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples are cheaper than sqlite3.Row
+            rows = cursor.execute(sql).fetchall()
+            names = [description[0] for description in cursor.description]
+        
+        n_rows = len(rows)
+        columns = dict(zip(names, zip(*rows) if n_rows else [()] * len(names)))
+        
+        data = {
+            "draw_id": np.array(columns["draw_id"], dtype=object),
+            # Integer epoch days reinterpreted as dates, no string parsing
+            "draw_date": np.fromiter(columns["draw_date_i"], dtype=np.int64, count=n_rows)
+                           .view("datetime64[D]").astype("datetime64[ns]"),
+        }
+        for name in _NUMBER_COLUMNS:
+            data[name] = _number_column(columns[name], n_rows)
+        data["jackpot"] = np.array(columns["jackpot"], dtype=np.float64)
+        
+        if include_blobs:
+            data["prize_table_json"] = np.array(columns["prize_table_json"], dtype=object)
+            decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+            data["raw_html"] = np.array(
+                [decompress_html(html, decompressor) for html in columns["raw_html"]],
+                dtype=object
             )
+        
+        return pd.DataFrame(data)
+    
+    def iter_draws(self, chunksize: int = 1000) -> Iterator[pd.DataFrame]:
+        """
+        Stream draws ordered by draw_date ASC in DataFrame chunks.
+        
+        Chunks are read through a dedicated read-only connection, so other
+        repository calls (from any thread) are not blocked while the caller
+        processes them. The whole iteration sees a single WAL snapshot.
+        
+        Args:
+            chunksize: Number of draws per chunk
             
-            # Convert draw_date to datetime for better handling
-            # Handle both string and datetime formats with explicit format
-            df["draw_date"] = pd.to_datetime(df["draw_date"], format='%Y-%m-%d', errors='coerce')
-            
-            # Remove rows with invalid dates
-            df = df.dropna(subset=['draw_date'])
+        Yields:
+            pd.DataFrame: Consecutive chunks with the all_draws_df() columns
+        """
+        # Create or migrate the file through the shared connection first
+        with self._connect():
+            pass
+        
+        conn = sqlite3.connect(f"{self._db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            conn.execute("PRAGMA busy_timeout=5000")
+            for chunk in pd.read_sql_query(
+                _SQL_ITER_DRAWS, conn, chunksize=chunksize, parse_dates=_READ_PARSE_DATES
+            ):
+                yield _with_number_dtypes(chunk)
+        finally:
+            conn.close()
+    
+    def count_draws(self) -> int:
+        """
+        Count stored draws without loading them.
+        
+        Returns:
+            int: Number of rows in the draws table
+        """
+        return self.get_stats()["total_draws"]
+    
+    def recent_draws(self, n: int) -> pd.DataFrame:
+        """
+        Get only the n most recent draws.
+        
+        Args:
+            n: Number of draws to return
             
-            return df
+        Returns:
+            pd.DataFrame: Draws ordered by draw_date DESC (newest first)
+        """
+        with self._connect() as conn:
+            return _with_number_dtypes(pd.read_sql_query(
+                _SQL_RECENT_DRAWS, conn, params=(n,), parse_dates=_READ_PARSE_DATES
+            ))
     
     def latest_draw_date(self) -> Optional[str]:
         """
         Get the date of the most recent draw.
         
+        The value is cached in the meta table until the draws table changes.
+        
         Returns:
             Optional[str]: Latest draw date in ISO format, or None if no draws
         """
         with self._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT draw_date 
-                FROM draws 
-                ORDER BY draw_date DESC 
-                LIMIT 1
-            """)
+            cursor.execute(_SQL_GET_META, (_META_LATEST_DRAW,))
+            cached = cursor.fetchone()
+            if cached is not None:
+                return cached["value"]
             
-            result = cursor.fetchone()
-            return result["draw_date"] if result else None
+            # MAX() always returns exactly one row (NULL on an empty table)
+            latest = cursor.execute(_SQL_LATEST_DATE).fetchone()[0]
+            
+            cursor.execute(_SQL_SET_META, (_META_LATEST_DRAW, latest))
+            conn.commit()
+            return latest
     
     def get_draw_by_id(self, draw_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -250,23 +620,16 @@ class EuromillionsRepository:
         """
         with self._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2,
-                       jackpot, prize_table_json, raw_html
-                FROM draws 
-                WHERE draw_id = ?
-            """, (draw_id,))
+            cursor.execute(_SQL_GET_BY_ID, (draw_id,))
             
             result = cursor.fetchone()
             if not result:
                 return None
             
-            # Convert to dict and parse JSON
+            # Convert to dict, parse JSON and restore the HTML text
             draw = dict(result)
-            if draw["prize_table_json"]:
-                draw["prize_table"] = json.loads(draw["prize_table_json"])
-            else:
-                draw["prize_table"] = None
+            draw["prize_table"] = decode_prize_table(draw["prize_table_json"])
+            draw["raw_html"] = decompress_html(draw["raw_html"])
             
             return draw
     
@@ -280,27 +643,187 @@ class EuromillionsRepository:
         with self._connect() as conn:
             cursor = conn.cursor()
             
-            # Count total draws
-            cursor.execute("SELECT COUNT(*) as count FROM draws")
-            total_draws = cursor.fetchone()["count"]
+            # Serve aggregates from the meta cache when all of them are present
+            cursor.execute(_SQL_GET_STATS_META, _META_STATS_KEYS)
+            cached = {row["key"]: row["value"] for row in cursor.fetchall()}
             
-            # Get date range
-            cursor.execute("""
-                SELECT MIN(draw_date) as earliest, MAX(draw_date) as latest 
-                FROM draws
-            """)
-            date_range = cursor.fetchone()
-            
-            # Get database file size
-            db_size = self._db_path.stat().st_size if self._db_path.exists() else 0
+            if len(cached) == len(_META_STATS_KEYS):
+                total_draws = int(cached[_META_TOTAL_DRAWS])
+                earliest = cached[_META_EARLIEST_DRAW]
+                latest = cached[_META_LATEST_DRAW]
+            else:
+                # Count total draws
+                cursor.execute(_SQL_COUNT)
+                total_draws = cursor.fetchone()["count"]
+                
+                # Get date range
+                cursor.execute(_SQL_DATE_RANGE)
+                date_range = cursor.fetchone()
+                earliest = date_range["earliest"]
+                latest = date_range["latest"]
+                
+                cursor.executemany(_SQL_SET_META, [
+                    (_META_TOTAL_DRAWS, str(total_draws)),
+                    (_META_EARLIEST_DRAW, earliest),
+                    (_META_LATEST_DRAW, latest),
+                ])
+                conn.commit()
             
-            return {
-                "total_draws": total_draws,
-                "earliest_draw": date_range["earliest"],
-                "latest_draw": date_range["latest"],
-                "db_file_size_bytes": db_size,
-                "db_path": str(self._db_path)
-            }
+        return {
+            "total_draws": total_draws,
+            "earliest_draw": earliest,
+            "latest_draw": latest,
+            "db_file_size_bytes": self._db_file_size(),
+            "db_path": self._db_path_str
+        }
+    
+    def _db_file_size(self) -> int:
+        """Database file size, re-read from disk only after this repository wrote."""
+        if self._db_size_cache is not None and self._db_size_cache[0] == self._write_version:
+            return self._db_size_cache[1]
+        
+        try:
+            db_size = os.path.getsize(self._db_path_str)
+        except OSError:
+            db_size = 0
+        
+        self._db_size_cache = (self._write_version, db_size)
+        return db_size
+
+
+def _number_column(values: tuple, n_rows: int) -> np.ndarray:
+    """
+    Build a ball/star column from raw SQLite values.
+    
+    Returns:
+        int16 array, or float64 with NaN for values that are not integers
+        (NULL, or numpy integers that sqlite3 stored as BLOBs)
+    """
+    try:
+        return np.fromiter(values, dtype=_NUMBER_DTYPE, count=n_rows)
+    except (TypeError, ValueError):
+        return np.array([value if isinstance(value, int) else np.nan for value in values], dtype=np.float64)
+
+
+def _with_number_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the all_draws_df() dtypes to a frame read with pandas."""
+    for name in _NUMBER_COLUMNS:
+        column = pd.to_numeric(df[name], errors="coerce")
+        df[name] = column.astype(_NUMBER_DTYPE) if column.notna().all() else column.astype(np.float64)
+    df["jackpot"] = pd.to_numeric(df["jackpot"], errors="coerce").astype(np.float64)
+    return df
+
+
+def _normalize_draw_date(draw_date: Any) -> Any:
+    """Turn a date/datetime, or a datetime string, into its YYYY-MM-DD part."""
+    if hasattr(draw_date, 'strftime'):
+        return draw_date.strftime('%Y-%m-%d')
+    if isinstance(draw_date, str) and len(draw_date) > 10:
+        # Handle datetime strings that might include time
+        return draw_date[:10]
+    return draw_date
+
+
+def _draw_problem(draw: Dict[str, Any]) -> Optional[str]:
+    """Why a draw cannot be stored, or None when it is valid."""
+    missing = _REQUIRED_DRAW_FIELDS.difference(draw)
+    if missing:
+        return f"missing {', '.join(sorted(missing))}"
+    
+    for name, low, high in _NUMBER_FIELD_RANGES:
+        value = draw[name]
+        # bool is an int subclass but never a valid ball
+        if isinstance(value, bool) or not isinstance(value, (int, np.integer)):
+            return f"{name}={value!r} is not an integer"
+        if not low <= value <= high:
+            return f"{name}={value} outside {low}-{high}"
+    
+    if _epoch_day(_normalize_draw_date(draw["draw_date"])) is None:
+        return f"invalid draw_date {draw['draw_date']!r}"
+    
+    return None
+
+
+def _epoch_day(draw_date: Any) -> Optional[int]:
+    """Days since 1970-01-01 for a YYYY-MM-DD string, None for anything else."""
+    try:
+        parsed = date.fromisoformat(draw_date)
+    except (TypeError, ValueError):
+        return None
+    if parsed.isoformat() != draw_date:
+        return None
+    return parsed.toordinal() - _EPOCH_ORDINAL
+
+
+def compress_html(html: Optional[str], compressor: Any = None) -> Optional[Union[str, bytes]]:
+    """
+    Zstd-compress raw HTML for storage.
+    
+    Args:
+        html: HTML text (None is passed through)
+        compressor: Reusable zstandard.ZstdCompressor; one is created if omitted
+        
+    Returns:
+        Compressed bytes, or the text unchanged when zstandard is unavailable
+    """
+    if html is None or not ZSTD_AVAILABLE:
+        return html
+    if compressor is None:
+        compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    return compressor.compress(html.encode("utf-8"))
+
+
+def decompress_html(stored: Optional[Union[str, bytes]], decompressor: Any = None) -> Optional[str]:
+    """
+    Restore raw HTML written by compress_html (plain text is returned as is).
+    
+    Args:
+        stored: Value read from the raw_html column
+        decompressor: Reusable zstandard.ZstdDecompressor; one is created if omitted
+        
+    Returns:
+        Optional[str]: The HTML text
+    """
+    if not isinstance(stored, bytes):
+        return stored
+    if not stored.startswith(_ZSTD_MAGIC):
+        return stored.decode("utf-8")
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("zstandard is required to read compressed raw_html")
+    if decompressor is None:
+        decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(stored).decode("utf-8")
+
+
+def encode_prize_table(prize_table: Any) -> Optional[str]:
+    """Serialize a prize table to JSON text (None when empty)."""
+    if not prize_table:
+        return None
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(prize_table, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(prize_table)
+
+
+def decode_prize_table(prize_table_json: Optional[str]) -> Any:
+    """Parse stored prize table JSON text (None when nothing was stored)."""
+    if not prize_table_json:
+        return None
+    if ORJSON_AVAILABLE:
+        return orjson.loads(prize_table_json)
+    return json.loads(prize_table_json)
+
+
+def parse_prize_tables(prize_table_json: pd.Series) -> pd.Series:
+    """
+    Decode a prize_table_json column into Python objects.
+    
+    Args:
+        prize_table_json: Raw JSON strings as returned by all_draws_df()
+        
+    Returns:
+        pd.Series: Parsed prize tables (None where no table was stored)
+    """
+    return prize_table_json.map(decode_prize_table)
 
 
 # Convenience functions for easy access
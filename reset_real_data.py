@@ -16,26 +16,11 @@ def reset_with_real_data():
     try:
         from repository import get_repository
         from hybrid_scraper import hybrid_scrape_latest
-        import sqlite3
-        from config import get_settings
         
-        # 1. Vider complètement la base
-        print('🗑️ Suppression des anciennes données...')
-        settings = get_settings()
-        db_path = settings.storage_path / 'draws.db'
-        
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM draws')
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
-        
-        print(f'   ✅ {deleted} anciennes entrées supprimées')
+        repo = get_repository()
         
-        # 2. Récupérer les vraies données
+        # 1. Récupérer les vraies données
         print('🕷️ Récupération des vraies données...')
-        repo = get_repository()
         
         # Récupérer les 100 derniers tirages réels
         real_draws = hybrid_scrape_latest(limit=100)
@@ -43,18 +28,17 @@ def reset_with_real_data():
         if real_draws:
             print(f'   ✅ {len(real_draws)} vrais tirages récupérés')
             
-            # 3. Insérer dans la base
-            print('💾 Insertion dans la base de données...')
-            result = repo.upsert_draws(real_draws)
+            # 2. Vider la base et insérer en une seule transaction
+            print('💾 Remplacement des données dans la base...')
+            result = repo.reset_and_load(real_draws)
             
+            print(f'   ✅ {result["deleted"]} anciennes entrées supprimées')
             print(f'   ✅ {result["inserted"]} tirages insérés')
-            print(f'   ✅ {result["updated"]} tirages mis à jour')
-            print(f'   ⚠️ {result["skipped"]} tirages ignorés')
+            print(f'   ⚠️ {result["errors"]} tirages ignorés')
             
-            # 4. Vérifier les derniers tirages
+            # 3. Vérifier les derniers tirages
             print('🔍 Vérification des derniers tirages:')
-            df = repo.all_draws_df()
-            recent = df.sort_values('draw_date', ascending=False).head(5)
+            recent = repo.recent_draws(5)
             
             for _, row in recent.iterrows():
                 date = row['draw_date'].strftime('%Y-%m-%d')
@@ -19,17 +19,17 @@ def retrain_with_real_data():
         
         # Vérifier les données disponibles
         repo = get_repository()
-        df = repo.all_draws_df()
+        n_draws = repo.count_draws()
         
-        print(f'📊 Données disponibles: {len(df)} tirages réels')
+        print(f'📊 Données disponibles: {n_draws} tirages réels')
         
-        if len(df) < 30:
-            print(f'⚠️  Peu de données ({len(df)} tirages)')
+        if n_draws < 30:
+            print(f'⚠️  Peu de données ({n_draws} tirages)')
             print('   Les performances peuvent être limitées')
         
         # Re-entraîner avec un seuil adapté
         print('\n🏋️ Démarrage de l\'entraînement...')
-        min_rows = min(30, len(df))  # Adapter au nombre de données disponibles
+        min_rows = min(30, n_draws)  # Adapter au nombre de données disponibles
         
         result = train_latest(min_rows=min_rows)
         
@@ -7,8 +7,13 @@ Provides simple, UI-friendly interfaces that handle errors gracefully
 and return consistent data structures for the web interface.
 """
 
+import asyncio
 import io
 import json
+import time
+from heapq import nlargest
+from itertools import repeat
+from operator import itemgetter
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -16,8 +21,32 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 from loguru import logger
 
+# Optional fast JSON codec
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_default(obj):
+    """Serialize the numpy scalars orjson does not handle natively (e.g. float16)."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 def convert_numpy_types(obj):
     """Recursively convert numpy types to Python native types for JSON serialization."""
+    if ORJSON_AVAILABLE:
+        # Aller-retour orjson : la conversion numpy est faite en C
+        try:
+            return orjson.loads(orjson.dumps(
+                obj, option=orjson.OPT_SERIALIZE_NUMPY, default=_orjson_default
+            ))
+        except orjson.JSONEncodeError:
+            pass  # Types non sérialisables : conversion Python ci-dessous
+    
     if isinstance(obj, dict):
         return {key: convert_numpy_types(value) for key, value in obj.items()}
     elif isinstance(obj, list):
@@ -51,6 +80,78 @@ except ImportError as e:
     HYBRID_STRATEGY_AVAILABLE = False
 
 
+def _selection_log_weights(weights: np.ndarray, pool: np.ndarray, weighted: np.ndarray) -> np.ndarray:
+    """
+    Build per-ticket log-weights for sampling without replacement.
+    
+    Args:
+        weights: Normalized weights of the candidate numbers, best first
+        pool: Per-ticket number of top candidates to draw uniformly from
+        weighted: Per-ticket flag, True to draw from all candidates by weight
+        
+    Returns:
+        np.ndarray: (n_tickets, n_candidates) log-weights, -inf for excluded
+    """
+    uniform = np.where(np.arange(len(weights)) < pool[:, None], 0.0, -np.inf)
+    with np.errstate(divide='ignore'):
+        log_weights = np.log(weights)
+    return np.where(weighted[:, None], log_weights, uniform)
+
+
+def _gumbel_top_k(log_weights: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw k distinct indices per row, proportionally to exp(log_weights).
+    
+    Gumbel-top-k trick: adding Gumbel noise to the log-weights and keeping the
+    k largest keys is equivalent to successive weighted sampling without
+    replacement, i.e. rng.choice(..., replace=False, p=...) for every row.
+    
+    Args:
+        log_weights: (n_rows, n_candidates) log-weights
+        k: Number of indices to draw per row
+        rng: Random generator
+        
+    Returns:
+        np.ndarray: (n_rows, k) candidate indices
+        
+    Raises:
+        ValueError: If a row has fewer than k finite log-weights, like
+            rng.choice(replace=False) with too few non-zero probabilities
+    """
+    # Otherwise argpartition would silently return excluded (-inf) candidates
+    short_rows = np.isfinite(log_weights).sum(axis=1) < k
+    if short_rows.any():
+        raise ValueError(
+            f"Cannot draw {k} distinct candidates: {int(short_rows.sum())} row(s) "
+            f"have fewer than {k} candidates with a non-zero weight"
+        )
+    
+    keys = log_weights + rng.gumbel(size=log_weights.shape)
+    return np.argpartition(-keys, k - 1, axis=1)[:, :k]
+
+# Durée de vie du cache DataFrame des tirages (secondes)
+_DRAWS_CACHE_TTL = 300
+
+# Bonus de confiance par méthode de génération
+_METHOD_CONFIDENCE_BONUS = {
+    "ensemble": 0.15,
+    "advanced_hybrid": 0.12,
+    "enhanced_hybrid": 0.08,
+    "enhanced_topk": 0.05,
+    "enhanced_random": 0.02
+}
+
+# Libellés "01".."50" indexés par numéro, pour l'affichage des tirages
+_NUMBER_LABELS = np.array([f"{number:02d}" for number in range(51)])
+
+# Seuils (croissants) et libellés des niveaux de confiance
+_CONFIDENCE_THRESHOLDS = np.array([35, 50, 65, 80])
+_CONFIDENCE_LEVELS = np.array(["Très Faible", "Faible", "Moyenne", "Élevée", "Très Élevée"])
+
+# Signature des données du dernier entraînement réussi (à côté des modèles)
+_TRAIN_SIGNATURE_FILE = ".train_signature.json"
+
+
 class StreamlitAdapters:
     """
     Streamlit UI adapter class providing simple interfaces for web UI.
@@ -63,6 +164,49 @@ class StreamlitAdapters:
         init_database()
         self.repo = get_repository()
         self.trainer = EuromillionsTrainer()
+        
+        # Cache of all_draws_df(), invalidated by our upserts or, after a TTL,
+        # when the draw count or latest draw date stored in the database changes
+        self._draws_version = 0
+        self._draws_cache: Optional[Tuple[int, float, Tuple[int, Any], pd.DataFrame]] = None
+        
+        # Latest ensemble feature rows, keyed on draw count and last draw date
+        self._features_cache: Optional[Tuple[str, Tuple[np.ndarray, np.ndarray]]] = None
+    
+    def _all_draws_df(self) -> pd.DataFrame:
+        """
+        Get all draws, memoized across UI actions.
+        
+        The cached DataFrame is reused until this adapter upserts new draws.
+        Once the TTL expires, the draw count and latest draw date (served from
+        the repository meta cache) are compared with the cached ones to pick
+        up writes made by other processes; the table is only re-read when
+        they differ. Callers must not modify the returned DataFrame in place.
+        
+        Returns:
+            pd.DataFrame: All draws ordered by draw_date ASC
+        """
+        now = time.monotonic()
+        cached = self._draws_cache
+        if cached is not None and cached[0] == self._draws_version:
+            if now - cached[1] < _DRAWS_CACHE_TTL:
+                return cached[3]
+            
+            stamp = self._draws_stamp()
+            if stamp == cached[2]:
+                self._draws_cache = (cached[0], now, stamp, cached[3])
+                return cached[3]
+        else:
+            stamp = self._draws_stamp()
+        
+        df = self.repo.all_draws_df()
+        self._draws_cache = (self._draws_version, now, stamp, df)
+        return df
+    
+    def _draws_stamp(self) -> Tuple[int, Any]:
+        """Cheap staleness key for the draws table: (count, latest draw date)."""
+        stats = self.repo.get_stats()
+        return stats["total_draws"], stats["latest_draw"]
     
     def init_full_history(self) -> Dict[str, Any]:
         """
@@ -75,38 +219,48 @@ class StreamlitAdapters:
         logger.info("Starting full history initialization")
         
         try:
-            # Get initial count
-            initial_df = self.repo.all_draws_df()
-            initial_count = len(initial_df)
-            
             # Crawl archive pages (this may take a while)
             logger.info("Crawling historical archive pages...")
-            all_draws = []
             
             # Try to scrape a reasonable amount of history
-            # We'll loop through pages until we get enough data or hit a limit
             max_pages = 50  # Reasonable limit to prevent infinite loops
             draws_per_page = 20  # Typical number of draws per page
             
-            for page in range(1, max_pages + 1):
-                try:
-                    logger.info(f"Crawling page {page}/{max_pages}")
-                    page_draws = scrape_latest_hybrid(limit=draws_per_page, offset=(page-1)*draws_per_page)
-                    
-                    if not page_draws:
-                        logger.info(f"No more draws found at page {page}, stopping")
-                        break
-                    
-                    all_draws.extend(page_draws)
-                    
-                    # Stop if we have a good amount of data
-                    if len(all_draws) >= 1000:
-                        logger.info(f"Collected {len(all_draws)} draws, sufficient for analysis")
-                        break
-                        
-                except Exception as e:
-                    logger.warning(f"Error on page {page}: {e}")
+            # Les pages sont récupérées en parallèle (I/O-bound), puis
+            # consommées dans l'ordre pour conserver l'arrêt naturel
+            page_results = asyncio.run(
+                self._crawl_archive_pages(max_pages, draws_per_page)
+            )
+            
+            all_draws = []
+            seen_dates = set()
+            duplicates = 0
+            for page, page_draws in enumerate(page_results, 1):
+                if isinstance(page_draws, Exception):
+                    logger.warning(f"Error on page {page}: {page_draws}")
                     break
+                
+                if not page_draws:
+                    logger.info(f"No more draws found at page {page}, stopping")
+                    break
+                
+                # Overlapping pages can return the same draw twice: keep one per date
+                for draw in page_draws:
+                    draw_date = str(draw.get("draw_date", ""))[:10]
+                    if draw_date:
+                        if draw_date in seen_dates:
+                            duplicates += 1
+                            continue
+                        seen_dates.add(draw_date)
+                    all_draws.append(draw)
+                
+                # Stop if we have a good amount of data
+                if len(all_draws) >= 1000:
+                    logger.info(f"Collected {len(all_draws)} draws, sufficient for analysis")
+                    break
+            
+            if duplicates:
+                logger.info(f"Skipped {duplicates} duplicate draws across archive pages")
             
             if not all_draws:
                 return {
@@ -119,19 +273,23 @@ class StreamlitAdapters:
                     "last_date": None
                 }
             
-            # Upsert all draws
+            # Upsert all draws (le repository découpe en lots transactionnels)
             logger.info(f"Upserting {len(all_draws)} historical draws")
             result = self.repo.upsert_draws(all_draws)
             inserted = result.get("inserted", 0)
             updated = result.get("updated", 0)
+            skipped = result.get("errors", 0)
+            self._draws_version += 1
+            if inserted or updated:
+                self._clear_feature_cache()
             
             # Get final statistics
-            final_df = self.repo.all_draws_df()
+            final_df = self._all_draws_df()
             final_count = len(final_df)
-            skipped = len(all_draws) - inserted - updated
             
-            first_date = final_df['draw_date'].min() if not final_df.empty else None
-            last_date = final_df['draw_date'].max() if not final_df.empty else None
+            # all_draws_df() is ordered by draw_date ASC: the extremes are the ends
+            first_date = final_df['draw_date'].iat[0] if final_count else None
+            last_date = final_df['draw_date'].iat[-1] if final_count else None
             
             result = {
                 "success": True,
@@ -159,6 +317,107 @@ class StreamlitAdapters:
                 "last_date": None
             }
     
+    def _latest_ensemble_features(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the most recent main/star feature rows for ensemble prediction.
+        
+        Building the enhanced datasets walks the whole history, but only the
+        last row is needed. It is kept in memory and persisted as .npy files in
+        the processed data directory, so it is rebuilt only when the draws
+        change (and not on every Streamlit restart).
+        
+        Returns:
+            tuple: (latest_main, latest_star) feature rows
+        """
+        df = self._all_draws_df()
+        tag = f"{len(df)}_{df['draw_date'].iat[-1]:%Y%m%d}" if len(df) else "empty"
+        
+        if self._features_cache is not None and self._features_cache[0] == tag:
+            return self._features_cache[1]
+        
+        main_path, star_path = self._feature_cache_paths(tag)
+        try:
+            latest_main = np.load(main_path)
+            latest_star = np.load(star_path)
+        except (OSError, ValueError):
+            from build_datasets import build_enhanced_datasets
+            X_main, _, X_star, _, _ = build_enhanced_datasets(df, window_size=100)
+            
+            # Use the most recent features (copies, so the full matrices can be freed)
+            latest_main = X_main[-1:].copy() if len(X_main) > 0 else np.zeros((1, 200))
+            latest_star = X_star[-1:].copy() if len(X_star) > 0 else np.zeros((1, 48))
+            
+            try:
+                self._clear_feature_cache()
+                np.save(main_path, latest_main)
+                np.save(star_path, latest_star)
+            except OSError as e:
+                logger.warning(f"Could not persist ensemble feature cache: {e}")
+        
+        self._features_cache = (tag, (latest_main, latest_star))
+        return latest_main, latest_star
+    
+    def _feature_cache_paths(self, tag: str) -> Tuple[Path, Path]:
+        """On-disk paths of the cached main/star feature rows for a data tag."""
+        base = self.settings.processed_data_path
+        return (base / f"ensemble_features_main_{tag}.npy",
+                base / f"ensemble_features_star_{tag}.npy")
+    
+    def _clear_feature_cache(self) -> None:
+        """Delete persisted ensemble feature rows (stale once draws change)."""
+        for path in self.settings.processed_data_path.glob("ensemble_features_*.npy"):
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"Could not delete stale feature cache {path}: {e}")
+    
+    async def _crawl_archive_pages(self, max_pages: int, draws_per_page: int,
+                                   max_concurrency: int = 10) -> List[Any]:
+        """
+        Fetch archive pages concurrently, stopping at the end of the archive.
+        
+        The scrapers are blocking (requests + BeautifulSoup), so each page is
+        dispatched to a worker thread. The sources expose no total count:
+        page 1 is fetched first, then pages are requested in waves of
+        `max_concurrency` until a wave contains the last page (short, empty
+        or failed), so no requests are wasted past the end of the archive.
+        
+        Args:
+            max_pages: Maximum number of archive pages to fetch
+            draws_per_page: Number of draws per page
+            max_concurrency: Maximum number of simultaneous page fetches
+            
+        Returns:
+            list: One entry per fetched page, in page order: the list of
+                  draws, or the exception raised while fetching that page
+        """
+        async def _fetch_page(page: int) -> List[Dict[str, Any]]:
+            logger.info(f"Crawling page {page}/{max_pages}")
+            return await asyncio.to_thread(
+                scrape_latest_hybrid,
+                limit=draws_per_page,
+                offset=(page - 1) * draws_per_page
+            )
+        
+        def _is_last_page(page_draws: Any) -> bool:
+            return isinstance(page_draws, Exception) or len(page_draws) < draws_per_page
+        
+        results = []
+        wave_start, wave_size = 1, 1  # Page 1 seule d'abord
+        while wave_start <= max_pages:
+            wave = range(wave_start, min(wave_start + wave_size, max_pages + 1))
+            wave_results = await asyncio.gather(
+                *(_fetch_page(page) for page in wave), return_exceptions=True
+            )
+            results.extend(wave_results)
+            
+            if any(_is_last_page(page_draws) for page_draws in wave_results):
+                break
+            
+            wave_start, wave_size = wave.stop, max_concurrency
+        
+        return results
+    
     def update_incremental(self) -> Dict[str, Any]:
         """
         Update with recent draws by scraping latest pages.
@@ -169,9 +428,6 @@ class StreamlitAdapters:
         logger.info("Starting incremental update")
         
         try:
-            # Get current latest date
-            current_df = self.repo.all_draws_df()
-            
             # Scrape recent draws (last few pages)
             recent_draws = get_best_available_draws(limit=100)  # Get recent 100 draws
             
@@ -188,7 +444,10 @@ class StreamlitAdapters:
             result = self.repo.upsert_draws(recent_draws)
             inserted = result.get("inserted", 0)
             updated = result.get("updated", 0)
-            skipped = len(recent_draws) - inserted - updated
+            skipped = result.get("errors", 0)
+            self._draws_version += 1
+            if inserted or updated:
+                self._clear_feature_cache()
             
             result = {
                 "success": True,
@@ -211,10 +470,16 @@ class StreamlitAdapters:
                 "skipped": 0
             }
     
-    def train_from_scratch(self) -> Dict[str, Any]:
+    def train_from_scratch(self, force: bool = False) -> Dict[str, Any]:
         """
         Train models from scratch using current data.
         
+        Training is skipped when the data (draw count and last draw date) is
+        unchanged since the last successful run and the models still exist.
+        
+        Args:
+            force: Retrain even if the data has not changed
+        
         Returns:
             dict: Training metrics and status
         """
@@ -222,7 +487,7 @@ class StreamlitAdapters:
         
         try:
             # Check if we have enough data
-            df = self.repo.all_draws_df()
+            df = self._all_draws_df()
             
             if df.empty:
                 return {
@@ -240,11 +505,32 @@ class StreamlitAdapters:
                     "star_logloss": None
                 }
             
+            signature = {
+                "n_draws": len(df),
+                "last_draw_date": str(df['draw_date'].iat[-1])
+            }
+            signature_path = self.trainer.models_path / _TRAIN_SIGNATURE_FILE
+            
+            if not force and self._read_train_signature(signature_path) == signature:
+                info = get_model_info()
+                if info.get("models_available", False):
+                    logger.info("No new data since last training, skipping")
+                    return {
+                        "success": True,
+                        "skipped": True,
+                        "message": "No new data since last training; skipped",
+                        "main_logloss": info.get("performance", {}).get("main_logloss"),
+                        "star_logloss": info.get("performance", {}).get("star_logloss"),
+                        "trained_at": info.get("trained_at"),
+                        "training_data_size": len(df)
+                    }
+            
             # Train models
             result = train_latest(min_rows=min(len(df), 100))
             
             if result and result.get("success", False):
                 metrics = result.get("performance", {})
+                self._write_train_signature(signature_path, signature)
                 
                 return {
                     "success": True,
@@ -272,6 +558,26 @@ class StreamlitAdapters:
                 "star_logloss": None
             }
     
+    @staticmethod
+    def _read_train_signature(path: Path) -> Optional[Dict[str, Any]]:
+        """Read the data signature of the last successful training, if any."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _write_train_signature(path: Path, signature: Dict[str, Any]) -> None:
+        """Atomically record the data signature of a successful training."""
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(signature, f)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not save training signature: {e}")
+    
     def reload_models(self) -> Dict[str, Any]:
         """
         Reload models from disk, forcing refresh.
@@ -331,19 +637,8 @@ class StreamlitAdapters:
             star_scores = self.trainer.score_stars()
             
             # Convert to DataFrames
-            balls_df = pd.DataFrame(ball_scores, columns=['ball', 'probability'])
-            balls_df['ball'] = balls_df['ball'].astype(int)  # Ensure Python int
-            balls_df['probability'] = balls_df['probability'].astype(float)  # Ensure Python float
-            balls_df = balls_df.sort_values('probability', ascending=False).reset_index(drop=True)
-            balls_df['rank'] = range(1, len(balls_df) + 1)
-            balls_df['percentage'] = (balls_df['probability'] * 100).round(2)
-            
-            stars_df = pd.DataFrame(star_scores, columns=['star', 'probability'])
-            stars_df['star'] = stars_df['star'].astype(int)  # Ensure Python int
-            stars_df['probability'] = stars_df['probability'].astype(float)  # Ensure Python float
-            stars_df = stars_df.sort_values('probability', ascending=False).reset_index(drop=True)
-            stars_df['rank'] = range(1, len(stars_df) + 1)
-            stars_df['percentage'] = (stars_df['probability'] * 100).round(2)
+            balls_df = self._scores_to_df(ball_scores, 'ball')
+            stars_df = self._scores_to_df(star_scores, 'star')
             
             return balls_df, stars_df
             
@@ -354,8 +649,37 @@ class StreamlitAdapters:
             empty_stars = pd.DataFrame(columns=['star', 'probability', 'rank', 'percentage'])
             return empty_balls, empty_stars
     
+    @staticmethod
+    def _scores_to_df(scores: List[Tuple[int, float]], key: str) -> pd.DataFrame:
+        """
+        Build a ranked score DataFrame from (number, probability) pairs.
+        
+        Args:
+            scores: List of (number, probability) tuples
+            key: Name of the number column ('ball' or 'star')
+            
+        Returns:
+            pd.DataFrame: Columns [key, probability, rank, percentage] sorted by
+                          probability descending
+        """
+        count = len(scores)
+        numbers = np.fromiter((num for num, _ in scores), dtype=np.int64, count=count)
+        probs = np.fromiter((prob for _, prob in scores), dtype=np.float64, count=count)
+        
+        # Un seul tri, colonnes déjà typées et ordonnées
+        order = np.argsort(-probs, kind='stable')
+        sorted_probs = probs[order]
+        
+        return pd.DataFrame({
+            key: numbers[order],
+            'probability': sorted_probs,
+            'rank': np.arange(1, count + 1),
+            'percentage': np.round(sorted_probs * 100, 2)
+        })
+    
     def suggest_tickets_ui(self, n: int = 10, method: str = "hybrid", seed: int = 42, 
-                          use_ensemble: bool = True, hybrid_weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+                          use_ensemble: bool = True, hybrid_weights: Optional[Dict[str, float]] = None,
+                          display_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Generate enhanced lottery ticket suggestions using multiple strategies.
         
@@ -365,6 +689,7 @@ class StreamlitAdapters:
             seed: Random seed for reproducibility
             use_ensemble: Whether to use ensemble models
             hybrid_weights: Custom weights for hybrid strategy
+            display_k: Number of best tickets to return (default: all)
             
         Returns:
             list: List of enhanced ticket dictionaries with confidence scores
@@ -386,33 +711,24 @@ class StreamlitAdapters:
                 # Enhanced version of existing methods
                 tickets = self._generate_enhanced_tickets(n, method, seed, use_ensemble)
             
-            # Add metadata and confidence scores
-            for ticket in tickets:
-                # Convert numpy types to native Python types for JSON serialization
-                if "balls" in ticket:
-                    ticket["balls"] = [int(x) for x in ticket["balls"]]
-                if "stars" in ticket:
-                    ticket["stars"] = [int(x) for x in ticket["stars"]]
-                
-                # Convert any numpy floats to Python floats
-                if "combined_score" in ticket:
-                    ticket["combined_score"] = float(ticket["combined_score"])
-                if "base_confidence" in ticket:
-                    ticket["base_confidence"] = float(ticket["base_confidence"])
-                
-                ticket["generated_at"] = datetime.now().isoformat()
+            # Add metadata and confidence scores (one timestamp for the batch)
+            generated_at = datetime.now().isoformat()
+            
+            # Calculate enhanced confidence scores for the whole batch at once
+            confidences = self._calculate_enhanced_confidence_batch(tickets)
+            levels = self._get_confidence_levels_batch(confidences)
+            
+            for ticket, confidence, level in zip(tickets, confidences.tolist(), levels):
+                ticket["generated_at"] = generated_at
                 ticket["model_version"] = "v2_enhanced"
-                
-                # Calculate enhanced confidence score
-                confidence = self._calculate_enhanced_confidence(ticket)
-                ticket["confidence"] = float(confidence)  # Ensure it's a Python float
-                ticket["confidence_level"] = self._get_confidence_level(confidence)
+                ticket["confidence"] = confidence
+                ticket["confidence_level"] = level
             
-            # Sort by confidence (highest first)
-            tickets.sort(key=lambda x: x.get("confidence", 0), reverse=True)
+            # Keep the best tickets by confidence (highest first)
+            tickets = nlargest(display_k or len(tickets), tickets, key=itemgetter("confidence"))
             
             # Convert all numpy types to Python types for JSON serialization
-            tickets = [convert_numpy_types(ticket) for ticket in tickets]
+            tickets = convert_numpy_types(tickets)
             
             logger.info(f"Generated {len(tickets)} enhanced tickets")
             return tickets
@@ -428,6 +744,33 @@ class StreamlitAdapters:
                 return self._generate_minimal_tickets(n, seed)
             return fallback_tickets
     
+    async def suggest_tickets_ui_async(self, n: int = 10, method: str = "hybrid", seed: int = 42,
+                                       use_ensemble: bool = True,
+                                       hybrid_weights: Optional[Dict[str, float]] = None,
+                                       display_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of suggest_tickets_ui.
+        
+        Generation (database read, feature building, model inference) runs in
+        a worker thread, so the event loop stays free and several requests can
+        overlap. Generators use their own seeded RNG, so concurrent calls do
+        not interfere.
+        
+        Args:
+            n: Number of tickets to generate
+            method: Generation method ("topk", "random", "hybrid", "ensemble", "advanced_hybrid")
+            seed: Random seed for reproducibility
+            use_ensemble: Whether to use ensemble models
+            hybrid_weights: Custom weights for hybrid strategy
+            display_k: Number of best tickets to return (default: all)
+            
+        Returns:
+            list: List of enhanced ticket dictionaries with confidence scores
+        """
+        return await asyncio.to_thread(
+            self.suggest_tickets_ui, n, method, seed, use_ensemble, hybrid_weights, display_k
+        )
+    
     def _generate_ensemble_tickets(self, n: int, seed: int) -> List[Dict[str, Any]]:
         """Generate tickets using ensemble models."""
         
@@ -443,66 +786,63 @@ class StreamlitAdapters:
                 return []
             
             tickets = []
-            np.random.seed(seed)
+            rng = np.random.default_rng(seed)
+            
+            # Features for prediction (last row of the enhanced datasets)
+            latest_main, latest_star = self._latest_ensemble_features()
+            
+            # Get ensemble predictions (identical for every ticket, computed once)
+            main_proba, star_proba = ensemble_trainer.predict_with_ensemble(latest_main, latest_star)
+            
+            # Extract probabilities for positive class (shape is (n_outputs, n_samples, n_classes))
+            # We want the probability of class 1 (ball/star appears) for each position
+            if main_proba.ndim == 3:
+                # Shape: (50, 1, 2) -> extract [:, 0, 1] -> (50,)
+                main_proba = main_proba[:, 0, 1]
+            elif main_proba.ndim == 2:
+                # Shape: (50, 2) -> extract [:, 1] -> (50,)
+                main_proba = main_proba[:, 1]
+                
+            if star_proba.ndim == 3:
+                # Shape: (12, 1, 2) -> extract [:, 0, 1] -> (12,)
+                star_proba = star_proba[:, 0, 1]
+            elif star_proba.ndim == 2:
+                # Shape: (12, 2) -> extract [:, 1] -> (12,)
+                star_proba = star_proba[:, 1]
+            
+            # Add some randomness for variety between tickets: one row per
+            # ticket, noise growing with the ticket index (none for the first)
+            noise_scale = (0.05 * np.arange(n))[:, None]
+            main_batch = np.clip(
+                main_proba + rng.normal(0, 1, (n, main_proba.size)) * noise_scale, 0, 1
+            )
+            star_batch = np.clip(
+                star_proba + rng.normal(0, 1, (n, star_proba.size)) * noise_scale, 0, 1
+            )
             
-            # Get latest data for predictions
-            repo = get_repository()
-            df = repo.all_draws_df()
+            # Select top candidates per ticket (0-based indices); the order inside
+            # the top-K is irrelevant since the picks below are uniform
+            top_balls_idx = np.argpartition(main_batch, -10, axis=1)[:, -10:]  # Top 10 candidates
+            top_stars_idx = np.argpartition(star_batch, -6, axis=1)[:, -6:]    # Top 6 candidates
             
-            # Build features for prediction (use last row as base)
-            from build_datasets import build_enhanced_datasets
-            X_main, _, X_star, _, _ = build_enhanced_datasets(df, window_size=100)
+            # Random selection from top candidates: random keys, keep the first k
+            ball_pick = np.argsort(rng.random(top_balls_idx.shape), axis=1)[:, :5]
+            star_pick = np.argsort(rng.random(top_stars_idx.shape), axis=1)[:, :2]
+            selected_balls_idx = np.sort(np.take_along_axis(top_balls_idx, ball_pick, axis=1), axis=1)
+            selected_stars_idx = np.sort(np.take_along_axis(top_stars_idx, star_pick, axis=1), axis=1)
+            
+            # Calculate confidence based on selected numbers' probabilities
+            balls_confidence = np.take_along_axis(main_batch, selected_balls_idx, axis=1).mean(axis=1)
+            stars_confidence = np.take_along_axis(star_batch, selected_stars_idx, axis=1).mean(axis=1)
+            combined_confidence = balls_confidence * 0.7 + stars_confidence * 0.3
             
-            # Use the most recent features
-            latest_main = X_main[-1:] if len(X_main) > 0 else np.zeros((1, 200))
-            latest_star = X_star[-1:] if len(X_star) > 0 else np.zeros((1, 48))
+            # Convert to 1-based numbering
+            all_balls = (selected_balls_idx + 1).tolist()
+            all_stars = (selected_stars_idx + 1).tolist()
             
             for i in range(n):
-                # Get ensemble predictions
-                main_proba, star_proba = ensemble_trainer.predict_with_ensemble(latest_main, latest_star)
-                
-                # Extract probabilities for positive class (shape is (n_outputs, n_samples, n_classes))
-                # We want the probability of class 1 (ball/star appears) for each position
-                if main_proba.ndim == 3:
-                    # Shape: (50, 1, 2) -> extract [:, 0, 1] -> (50,)
-                    main_proba = main_proba[:, 0, 1]
-                elif main_proba.ndim == 2:
-                    # Shape: (50, 2) -> extract [:, 1] -> (50,)
-                    main_proba = main_proba[:, 1]
-                    
-                if star_proba.ndim == 3:
-                    # Shape: (12, 1, 2) -> extract [:, 0, 1] -> (12,)
-                    star_proba = star_proba[:, 0, 1]
-                elif star_proba.ndim == 2:
-                    # Shape: (12, 2) -> extract [:, 1] -> (12,)
-                    star_proba = star_proba[:, 1]
-                
-                # Add some randomness for variety between tickets
-                if i > 0:
-                    noise_factor = 0.05 * i  # Small noise for diversity
-                    main_proba = main_proba + np.random.normal(0, noise_factor, len(main_proba))
-                    star_proba = star_proba + np.random.normal(0, noise_factor, len(star_proba))
-                    
-                    # Ensure probabilities stay positive
-                    main_proba = np.clip(main_proba, 0, 1)
-                    star_proba = np.clip(star_proba, 0, 1)
-                
-                # Select top candidates with some randomness
-                top_balls_idx = np.argsort(main_proba)[-10:]  # Top 10 candidates
-                top_stars_idx = np.argsort(star_proba)[-6:]   # Top 6 candidates
-                
-                # Convert to 1-based numbering
-                top_balls = top_balls_idx + 1
-                top_stars = top_stars_idx + 1
-                
-                # Random selection from top candidates
-                selected_balls = sorted(np.random.choice(top_balls, 5, replace=False))
-                selected_stars = sorted(np.random.choice(top_stars, 2, replace=False))
-                
-                # Calculate confidence based on selected numbers' probabilities
-                balls_confidence = np.mean([main_proba[b-1] for b in selected_balls])
-                stars_confidence = np.mean([star_proba[s-1] for s in selected_stars])
-                combined_confidence = balls_confidence * 0.7 + stars_confidence * 0.3
+                selected_balls = all_balls[i]
+                selected_stars = all_stars[i]
                 
                 ticket = {
                     "ticket_id": i + 1,
@@ -512,7 +852,7 @@ class StreamlitAdapters:
                     "stars_str": " - ".join(f"{s:02d}" for s in selected_stars),
                     "method": "ensemble",
                     "ensemble_type": "multi_algorithm",
-                    "base_confidence": float(combined_confidence)
+                    "base_confidence": float(combined_confidence[i])
                 }
                 
                 tickets.append(ticket)
@@ -558,7 +898,7 @@ class StreamlitAdapters:
                 ml_predictions = self.trainer.predict_next_draw(return_probabilities=True)
             
             # Get historical data
-            df = self.repo.all_draws_df()
+            df = self._all_draws_df()
             
             # Generate hybrid predictions
             combinations = hybrid_strategy.predict_hybrid(df, ml_predictions)
@@ -609,7 +949,7 @@ class StreamlitAdapters:
             
             # Generate combinations using enhanced scoring
             combinations = self._generate_combinations_from_scores(
-                ball_scores, star_scores, n, method, seed
+                ball_scores, star_scores, n, method, np.random.default_rng(seed)
             )
             
             # Convert to ticket format
@@ -635,10 +975,9 @@ class StreamlitAdapters:
     
     def _generate_combinations_from_scores(self, ball_scores: List[Tuple[int, float]], 
                                          star_scores: List[Tuple[int, float]], 
-                                         n: int, method: str, seed: int) -> List[Dict[str, Any]]:
-        """Generate combinations from ball and star scores."""
-        
-        np.random.seed(seed)
+                                         n: int, method: str,
+                                         rng: np.random.Generator) -> List[Dict[str, Any]]:
+        """Generate combinations from ball and star scores using the given RNG."""
         
         combinations = []
         
@@ -646,101 +985,82 @@ class StreamlitAdapters:
         ball_scores.sort(key=lambda x: x[1], reverse=True)
         star_scores.sort(key=lambda x: x[1], reverse=True)
         
-        for i in range(n):
-            if method == "topk":
-                # Select top balls with slight variation
-                top_balls = [ball for ball, _ in ball_scores[:8 + i]]
-                selected_balls = sorted(np.random.choice(top_balls, 5, replace=False))
-                
-                top_stars = [star for star, _ in star_scores[:3 + i]]
-                selected_stars = sorted(np.random.choice(top_stars, 2, replace=False))
-                
-            elif method == "random":
-                # Weighted random selection
-                ball_weights = np.array([score for _, score in ball_scores])
-                ball_weights = ball_weights / np.sum(ball_weights)
-                
-                star_weights = np.array([score for _, score in star_scores])
-                star_weights = star_weights / np.sum(star_weights)
-                
-                ball_numbers = [ball for ball, _ in ball_scores]
-                star_numbers = [star for star, _ in star_scores]
-                
-                selected_balls = sorted(np.random.choice(ball_numbers, 5, replace=False, p=ball_weights))
-                selected_stars = sorted(np.random.choice(star_numbers, 2, replace=False, p=star_weights))
-                
-            else:  # hybrid
-                # Mix of top and random
-                if i < n // 2:
-                    # First half: more top-heavy
-                    top_balls = [ball for ball, _ in ball_scores[:12]]
-                    selected_balls = sorted(np.random.choice(top_balls, 5, replace=False))
-                    
-                    top_stars = [star for star, _ in star_scores[:4]]
-                    selected_stars = sorted(np.random.choice(top_stars, 2, replace=False))
-                else:
-                    # Second half: more random
-                    all_balls = [ball for ball, _ in ball_scores]
-                    ball_weights = np.array([score for _, score in ball_scores])
-                    ball_weights = ball_weights / np.sum(ball_weights)
-                    
-                    selected_balls = sorted(np.random.choice(all_balls, 5, replace=False, p=ball_weights))
-                    
-                    all_stars = [star for star, _ in star_scores]
-                    star_weights = np.array([score for _, score in star_scores])
-                    star_weights = star_weights / np.sum(star_weights)
-                    
-                    selected_stars = sorted(np.random.choice(all_stars, 2, replace=False, p=star_weights))
-            
-            # Calculate combination score
-            ball_score = np.mean([score for ball, score in ball_scores if ball in selected_balls])
-            star_score = np.mean([score for star, score in star_scores if star in selected_stars])
-            combined_score = ball_score * 0.7 + star_score * 0.3
-            
+        # Numbers, scores and normalized weights are constant across tickets:
+        # build them once, the loop below only draws indices
+        ball_numbers = np.fromiter((ball for ball, _ in ball_scores), dtype=np.int64, count=len(ball_scores))
+        ball_probs = np.fromiter((score for _, score in ball_scores), dtype=np.float64, count=len(ball_scores))
+        ball_weights = ball_probs / ball_probs.sum()
+        
+        star_numbers = np.fromiter((star for star, _ in star_scores), dtype=np.int64, count=len(star_scores))
+        star_probs = np.fromiter((score for _, score in star_scores), dtype=np.float64, count=len(star_scores))
+        star_weights = star_probs / star_probs.sum()
+        
+        # Per-ticket sampling plan: uniform over the top `pool` numbers, or
+        # weighted by score over all numbers
+        ticket_idx = np.arange(n)
+        if method == "topk":
+            # Select top numbers with slight variation
+            weighted = np.zeros(n, dtype=bool)
+            ball_pool = 8 + ticket_idx
+            star_pool = 3 + ticket_idx
+        elif method == "random":
+            # Weighted random selection
+            weighted = np.ones(n, dtype=bool)
+            ball_pool = star_pool = np.zeros(n, dtype=int)  # no uniform pool
+        else:  # hybrid
+            # First half more top-heavy, second half more random
+            weighted = ticket_idx >= n // 2
+            ball_pool = np.full(n, 12)
+            star_pool = np.full(n, 4)
+        
+        # All tickets are drawn at once
+        ball_idx = _gumbel_top_k(_selection_log_weights(ball_weights, ball_pool, weighted), 5, rng)
+        star_idx = _gumbel_top_k(_selection_log_weights(star_weights, star_pool, weighted), 2, rng)
+        
+        all_balls = np.sort(ball_numbers[ball_idx], axis=1).tolist()
+        all_stars = np.sort(star_numbers[star_idx], axis=1).tolist()
+        
+        # Calculate combination scores
+        combined_scores = ball_probs[ball_idx].mean(axis=1) * 0.7 + star_probs[star_idx].mean(axis=1) * 0.3
+        
+        for selected_balls, selected_stars, combined_score in zip(all_balls, all_stars, combined_scores):
             combination = {
                 "balls": selected_balls,
                 "stars": selected_stars,
-                "score": combined_score
+                "score": float(combined_score)
             }
             
             combinations.append(combination)
         
         return combinations
     
-    def _calculate_enhanced_confidence(self, ticket: Dict[str, Any]) -> float:
-        """Calculate enhanced confidence score for a ticket."""
-        
-        base_confidence = ticket.get("base_confidence", 0.5)
-        
-        # Add factors based on method
-        method_bonus = {
-            "ensemble": 0.15,
-            "advanced_hybrid": 0.12,
-            "enhanced_hybrid": 0.08,
-            "enhanced_topk": 0.05,
-            "enhanced_random": 0.02
-        }
-        
-        bonus = method_bonus.get(ticket.get("method", ""), 0)
-        
-        # Calculate final confidence (0-100)
-        final_confidence = min(95, (base_confidence + bonus) * 100)
+    @staticmethod
+    def _calculate_enhanced_confidence_batch(tickets: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Calculate enhanced confidence scores (0-95) for a batch of tickets.
         
-        return round(final_confidence, 1)
+        Args:
+            tickets: Ticket dictionaries with base_confidence and method (all
+                ticket generators set both keys)
+            
+        Returns:
+            np.ndarray: Final confidences, rounded to one decimal
+        """
+        count = len(tickets)
+        # Field extraction runs through C-level map/itemgetter, no per-ticket Python frame
+        base_confidence = np.fromiter(
+            map(itemgetter("base_confidence"), tickets), dtype=np.float64, count=count
+        )
+        method_bonus = np.fromiter(
+            map(_METHOD_CONFIDENCE_BONUS.get, map(itemgetter("method"), tickets), repeat(0.0)),
+            dtype=np.float64, count=count
+        )
+        return np.round(np.minimum(95, (base_confidence + method_bonus) * 100), 1)
     
-    def _get_confidence_level(self, confidence: float) -> str:
-        """Get confidence level description."""
-        
-        if confidence >= 80:
-            return "Très Élevée"
-        elif confidence >= 65:
-            return "Élevée"
-        elif confidence >= 50:
-            return "Moyenne"
-        elif confidence >= 35:
-            return "Faible"
-        else:
-            return "Très Faible"
+    @staticmethod
+    def _get_confidence_levels_batch(confidences: np.ndarray) -> List[str]:
+        """Get confidence level descriptions for a batch of confidence scores."""
+        return _CONFIDENCE_LEVELS[np.searchsorted(_CONFIDENCE_THRESHOLDS, confidences, side='right')].tolist()
     
     def _generate_fallback_tickets(self, n: int, method: str, seed: int) -> List[Dict[str, Any]]:
         """Generate basic fallback tickets if enhanced methods fail."""
@@ -751,17 +1071,23 @@ class StreamlitAdapters:
             combinations = self.trainer.suggest_combinations(k=n, method=method, seed=seed)
             
             tickets = []
-            for i, combo in enumerate(combinations, 1):
+            generated_at = datetime.now().isoformat()
+            
+            # Cast all combinations to Python ints in one vectorized pass
+            all_balls = np.asarray([combo["balls"] for combo in combinations]).astype(int).tolist()
+            all_stars = np.asarray([combo["stars"] for combo in combinations]).astype(int).tolist()
+            
+            for i, (balls, stars) in enumerate(zip(all_balls, all_stars), 1):
                 ticket = {
                     "ticket_id": i,
-                    "balls": [int(x) for x in combo["balls"]],
-                    "stars": [int(x) for x in combo["stars"]],
-                    "balls_str": " - ".join(f"{int(b):02d}" for b in combo["balls"]),
-                    "stars_str": " - ".join(f"{int(s):02d}" for s in combo["stars"]),
+                    "balls": balls,
+                    "stars": stars,
+                    "balls_str": " - ".join(f"{b:02d}" for b in balls),
+                    "stars_str": " - ".join(f"{s:02d}" for s in stars),
                     "method": f"fallback_{method}",
                     "confidence": 45.0,
                     "confidence_level": "Moyenne",
-                    "generated_at": datetime.now().isoformat()
+                    "generated_at": generated_at
                 }
                 tickets.append(ticket)
             
@@ -775,24 +1101,28 @@ class StreamlitAdapters:
         """Generate minimal random tickets as last resort."""
         
         try:
-            np.random.seed(seed)
+            rng = np.random.default_rng(seed)
             tickets = []
+            generated_at = datetime.now().isoformat()
             
-            for i in range(n):
-                # Generate completely random valid tickets
-                balls = sorted(np.random.choice(range(1, 51), 5, replace=False))
-                stars = sorted(np.random.choice(range(1, 13), 2, replace=False))
-                
+            # Generate completely random valid tickets, all at once: the k
+            # smallest of n uniform keys per row form a uniform k-subset
+            all_balls = np.argpartition(rng.random((n, 50)), 4, axis=1)[:, :5] + 1
+            all_stars = np.argpartition(rng.random((n, 12)), 1, axis=1)[:, :2] + 1
+            all_balls.sort(axis=1)
+            all_stars.sort(axis=1)
+            
+            for i, (balls, stars) in enumerate(zip(all_balls.tolist(), all_stars.tolist()), 1):
                 ticket = {
-                    "ticket_id": i + 1,
-                    "balls": balls.tolist(),
-                    "stars": stars.tolist(),
+                    "ticket_id": i,
+                    "balls": balls,
+                    "stars": stars,
                     "balls_str": " - ".join(f"{b:02d}" for b in balls),
                     "stars_str": " - ".join(f"{s:02d}" for s in stars),
                     "method": "minimal_random",
                     "confidence": 20.0,
                     "confidence_level": "Faible",
-                    "generated_at": datetime.now().isoformat()
+                    "generated_at": generated_at
                 }
                 tickets.append(ticket)
             
@@ -814,24 +1144,22 @@ class StreamlitAdapters:
             pd.DataFrame: Recent draws sorted by date descending
         """
         try:
-            df = self.repo.all_draws_df()
+            df = self._all_draws_df()
             
             if df.empty:
                 return pd.DataFrame(columns=['draw_date', 'n1', 'n2', 'n3', 'n4', 'n5', 's1', 's2'])
             
-            # Sort by date and take most recent
-            recent_df = df.sort_values('draw_date', ascending=False).head(limit).copy()
+            # all_draws_df() is ordered by draw_date ASC: the most recent draws
+            # are the last rows, reversed (no full sort needed)
+            recent_df = df.tail(limit).iloc[::-1].copy()
             
-            # Format for display
-            recent_df['draw_date'] = pd.to_datetime(recent_df['draw_date'], errors='coerce').dt.strftime('%Y-%m-%d')
-            recent_df['balls'] = recent_df.apply(
-                lambda row: f"{row['n1']:02d}-{row['n2']:02d}-{row['n3']:02d}-{row['n4']:02d}-{row['n5']:02d}", 
-                axis=1
-            )
-            recent_df['stars'] = recent_df.apply(
-                lambda row: f"{row['s1']:02d}-{row['s2']:02d}", 
-                axis=1
-            )
+            # Format for display (draw_date is already datetime64 from the repository)
+            recent_df['draw_date'] = recent_df['draw_date'].dt.strftime('%Y-%m-%d')
+            # Zero-padded labels are gathered from a lookup table, then joined per row
+            balls = _NUMBER_LABELS[recent_df[['n1', 'n2', 'n3', 'n4', 'n5']].to_numpy()].tolist()
+            stars = _NUMBER_LABELS[recent_df[['s1', 's2']].to_numpy()].tolist()
+            recent_df['balls'] = ['-'.join(row) for row in balls]
+            recent_df['stars'] = ['-'.join(row) for row in stars]
             
             # Select display columns
             display_df = recent_df[['draw_date', 'balls', 'stars', 'n1', 'n2', 'n3', 'n4', 'n5', 's1', 's2']].copy()
@@ -850,27 +1178,30 @@ class StreamlitAdapters:
             tuple: (filename, csv_bytes) for Streamlit download
         """
         try:
-            df = self.repo.all_draws_df()
+            df = self._all_draws_df()
             
             if df.empty:
                 # Return empty CSV
                 empty_csv = "draw_date,n1,n2,n3,n4,n5,s1,s2\n"
                 return "euromillions_draws_empty.csv", empty_csv.encode()
             
+            # Date range for the filename, read on the datetime column: all_draws_df()
+            # is ordered by draw_date ASC, so the extremes are the first and last rows
+            first_date = df['draw_date'].iat[0].strftime('%Y-%m-%d')
+            last_date = df['draw_date'].iat[-1].strftime('%Y-%m-%d')
+            
             # Sort by date
             df_sorted = df.sort_values('draw_date', ascending=False).copy()
             
-            # Format date column
-            df_sorted['draw_date'] = pd.to_datetime(df_sorted['draw_date'], errors='coerce').dt.strftime('%Y-%m-%d')
+            # Format date column (already datetime64, no parsing needed)
+            df_sorted['draw_date'] = df_sorted['draw_date'].dt.strftime('%Y-%m-%d')
             
-            # Convert to CSV
-            csv_buffer = io.StringIO()
-            df_sorted.to_csv(csv_buffer, index=False)
-            csv_bytes = csv_buffer.getvalue().encode()
+            # Convert to CSV, encoded by pandas straight into a bytes buffer
+            csv_buffer = io.BytesIO()
+            df_sorted.to_csv(csv_buffer, index=False, encoding='utf-8')
+            csv_bytes = csv_buffer.getvalue()
             
             # Generate filename with date range
-            first_date = df_sorted['draw_date'].iloc[-1]  # Oldest (last in desc order)
-            last_date = df_sorted['draw_date'].iloc[0]    # Newest (first in desc order)
             filename = f"euromillions_draws_{first_date}_to_{last_date}.csv"
             
             return filename, csv_bytes
@@ -889,12 +1220,21 @@ class StreamlitAdapters:
         """
         try:
             # Database status
-            df = self.repo.all_draws_df()
+            df = self._all_draws_df()
+            count = len(df)
+            has_data = count > 0
+            if has_data:
+                # Ordered by draw_date ASC: first and last rows give the range
+                draw_dates = df['draw_date']
+                first_date = draw_dates.iat[0].strftime('%Y-%m-%d')
+                last_date = draw_dates.iat[-1].strftime('%Y-%m-%d')
+            else:
+                first_date = last_date = None
             data_status = {
-                "available": not df.empty,
-                "count": len(df),
-                "first_date": df['draw_date'].min().strftime('%Y-%m-%d') if not df.empty else None,
-                "last_date": df['draw_date'].max().strftime('%Y-%m-%d') if not df.empty else None
+                "available": has_data,
+                "count": count,
+                "first_date": first_date,
+                "last_date": last_date
             }
             
             # Model status
@@ -951,9 +1291,9 @@ def update_incremental() -> dict:
     return streamlit_adapters.update_incremental()
 
 
-def train_from_scratch() -> dict:
-    """Train models from scratch."""
-    return streamlit_adapters.train_from_scratch()
+def train_from_scratch(force: bool = False) -> dict:
+    """Train models from scratch (skipped if the data is unchanged unless forced)."""
+    return streamlit_adapters.train_from_scratch(force)
 
 
 def reload_models() -> dict:
@@ -967,9 +1307,17 @@ def get_scores() -> tuple:
 
 
 def suggest_tickets_ui(n: int = 10, method: str = "hybrid", seed: int = 42, 
-                      use_ensemble: bool = True, hybrid_weights: Optional[Dict[str, float]] = None) -> list:
+                      use_ensemble: bool = True, hybrid_weights: Optional[Dict[str, float]] = None,
+                      display_k: Optional[int] = None) -> list:
     """Generate enhanced lottery ticket suggestions."""
-    return streamlit_adapters.suggest_tickets_ui(n, method, seed, use_ensemble, hybrid_weights)
+    return streamlit_adapters.suggest_tickets_ui(n, method, seed, use_ensemble, hybrid_weights, display_k)
+
+
+async def suggest_tickets_ui_async(n: int = 10, method: str = "hybrid", seed: int = 42,
+                                   use_ensemble: bool = True, hybrid_weights: Optional[Dict[str, float]] = None,
+                                   display_k: Optional[int] = None) -> list:
+    """Generate enhanced lottery ticket suggestions without blocking the event loop."""
+    return await streamlit_adapters.suggest_tickets_ui_async(n, method, seed, use_ensemble, hybrid_weights, display_k)
 
 
 def train_ensemble_models() -> dict:
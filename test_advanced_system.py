@@ -12,6 +12,7 @@ Ce script:
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import json
 from loguru import logger
@@ -132,15 +133,16 @@ def test_correlation_engine():
         else:
             current_date += timedelta(days=4)  # Vendredi -> Mardi
     
+    # Numéros typés comme dans repository.all_draws_df() (int16 au lieu d'int64)
     test_draws = pd.DataFrame({
         'draw_date': dates,
-        'n1': [1, 7, 13, 19, 25, 31, 37, 43, 5, 11],
-        'n2': [2, 8, 14, 20, 26, 32, 38, 44, 6, 12],
-        'n3': [3, 9, 15, 21, 27, 33, 39, 45, 7, 13],
-        'n4': [4, 10, 16, 22, 28, 34, 40, 46, 8, 14],
-        'n5': [5, 11, 17, 23, 29, 35, 41, 47, 9, 15],
-        's1': [1, 3, 5, 7, 9, 11, 1, 3, 5, 7],
-        's2': [2, 4, 6, 8, 10, 12, 2, 4, 6, 8]
+        'n1': np.array([1, 7, 13, 19, 25, 31, 37, 43, 5, 11], dtype=np.int16),
+        'n2': np.array([2, 8, 14, 20, 26, 32, 38, 44, 6, 12], dtype=np.int16),
+        'n3': np.array([3, 9, 15, 21, 27, 33, 39, 45, 7, 13], dtype=np.int16),
+        'n4': np.array([4, 10, 16, 22, 28, 34, 40, 46, 8, 14], dtype=np.int16),
+        'n5': np.array([5, 11, 17, 23, 29, 35, 41, 47, 9, 15], dtype=np.int16),
+        's1': np.array([1, 3, 5, 7, 9, 11, 1, 3, 5, 7], dtype=np.int16),
+        's2': np.array([2, 4, 6, 8, 10, 12, 2, 4, 6, 8], dtype=np.int16)
     })
     
     print(f"   ✓ Dataset créé: {len(test_draws)} tirages")
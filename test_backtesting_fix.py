@@ -5,29 +5,54 @@ Execute un backtesting rapide et vérifie que les résultats sont non-nuls.
 """
 
 from repository import get_repository
+import numpy as np
 import pandas as pd
 
+# Seules colonnes utilisées par ces tests
+DRAW_COLUMNS = ['draw_date', 'n1', 'n2', 'n3', 'n4', 'n5', 's1', 's2']
+
+# Nombre de tirages récents dont les tests ont besoin
+N_RECENT_DRAWS = 10
+
+# Tirages récents partagés par tous les tests (lus une seule fois)
+_recent_draws = None
+
+
+def _get_recent_draws() -> pd.DataFrame:
+    """Les N_RECENT_DRAWS derniers tirages, du plus ancien au plus récent."""
+    global _recent_draws
+    if _recent_draws is None:
+        # recent_draws() ne lit que les n dernières lignes (ordre décroissant)
+        _recent_draws = get_repository().recent_draws(N_RECENT_DRAWS).iloc[::-1].reset_index(drop=True)
+    return _recent_draws
+
+
+def _attach_main_stars(df: pd.DataFrame) -> pd.DataFrame:
+    """Ajouter les colonnes 'main' et 'stars' (listes) en empilant les colonnes de numéros."""
+    df['main'] = df[['n1', 'n2', 'n3', 'n4', 'n5']].to_numpy(dtype=np.int8).tolist()
+    df['stars'] = df[['s1', 's2']].to_numpy(dtype=np.int8).tolist()
+    return df
+
+
+def _last_draw_numbers(draws: pd.DataFrame) -> tuple:
+    """Numéros et étoiles du dernier tirage, lus directement dans les colonnes."""
+    last_row = draws[DRAW_COLUMNS[1:]].to_numpy()[-1].tolist()
+    return last_row[:5], last_row[5:]
+
+
 def test_data_conversion():
     """Test que les données sont correctement converties."""
     print("🔍 Test 1: Conversion des données...")
     
-    repo = get_repository()
-    all_draws = repo.all_draws_df()
+    recent_draws = _get_recent_draws()
     
-    if len(all_draws) == 0:
+    if len(recent_draws) == 0:
         print("❌ ÉCHEC: Base de données vide !")
         return False
     
     # Convertir
-    test_draws = all_draws.tail(10).copy()
-    test_draws['main'] = test_draws.apply(
-        lambda row: [row['n1'], row['n2'], row['n3'], row['n4'], row['n5']], 
-        axis=1
-    )
-    test_draws['stars'] = test_draws.apply(
-        lambda row: [row['s1'], row['s2']], 
-        axis=1
-    )
+    # La sélection de colonnes produit une copie: le cache partagé reste intact
+    test_draws = _attach_main_stars(recent_draws[DRAW_COLUMNS])
     
     # Vérifier
     first_draw = test_draws.iloc[0]
@@ -52,29 +77,17 @@ def test_ticket_evaluation():
     """Test que l'évaluation des tickets fonctionne."""
     print("\n🔍 Test 2: Évaluation des tickets...")
     
-    repo = get_repository()
-    all_draws = repo.all_draws_df()
-    test_draws = all_draws.tail(1).copy()
-    test_draws['main'] = test_draws.apply(
-        lambda row: [row['n1'], row['n2'], row['n3'], row['n4'], row['n5']], 
-        axis=1
-    )
-    test_draws['stars'] = test_draws.apply(
-        lambda row: [row['s1'], row['s2']], 
-        axis=1
-    )
-    
-    actual_draw = test_draws.iloc[0]
+    actual_main, actual_stars = _last_draw_numbers(_get_recent_draws())
     
     # Créer un ticket qui correspond exactement (jackpot simulé)
     ticket_perfect = {
-        'main': list(actual_draw['main']),
-        'stars': list(actual_draw['stars'])
+        'main': list(actual_main),
+        'stars': list(actual_stars)
     }
     
     # Évaluer
-    main_matches = len(set(ticket_perfect['main']) & set(actual_draw['main']))
-    star_matches = len(set(ticket_perfect['stars']) & set(actual_draw['stars']))
+    main_matches = len(set(ticket_perfect['main']) & set(actual_main))
+    star_matches = len(set(ticket_perfect['stars']) & set(actual_stars))
     score = main_matches * 10 + star_matches * 5
     
     print(f"   Ticket parfait : {main_matches} nums, {star_matches} étoiles, score={score}")
@@ -91,29 +104,14 @@ def test_partial_match():
     """Test avec correspondances partielles."""
     print("\n🔍 Test 3: Correspondances partielles...")
     
-    repo = get_repository()
-    all_draws = repo.all_draws_df()
-    test_draws = all_draws.tail(1).copy()
-    test_draws['main'] = test_draws.apply(
-        lambda row: [row['n1'], row['n2'], row['n3'], row['n4'], row['n5']], 
-        axis=1
-    )
-    test_draws['stars'] = test_draws.apply(
-        lambda row: [row['s1'], row['s2']], 
-        axis=1
-    )
-    
-    actual_draw = test_draws.iloc[0]
-    
-    # Ticket avec 2 bons numéros et 0 étoiles
-    actual_main = list(actual_draw['main'])
-    ticket_partial = {
-        'main': actual_main[:2] + [99, 98, 97],  # 2 corrects + 3 faux
-        'stars': [11, 12]  # 0 correct
-    }
+    actual_main, actual_stars = _last_draw_numbers(_get_recent_draws())
+    
+    # Ticket avec 2 bons numéros et 0 étoiles (seule la sémantique d'ensemble compte)
+    ticket_main = frozenset(actual_main[:2]) | {99, 98, 97}  # 2 corrects + 3 faux
+    ticket_stars = frozenset({11, 12})  # 0 correct
     
-    main_matches = len(set(ticket_partial['main']) & set(actual_draw['main']))
-    star_matches = len(set(ticket_partial['stars']) & set(actual_draw['stars']))
+    main_matches = len(ticket_main.intersection(actual_main))
+    star_matches = len(ticket_stars.intersection(actual_stars))
     score = main_matches * 10 + star_matches * 5
     
     print(f"   Ticket partiel : {main_matches} nums, {star_matches} étoiles, score={score}")
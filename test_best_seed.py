@@ -7,23 +7,95 @@ pour déterminer lesquelles auraient donné les meilleurs résultats
 sur les tirages passés.
 """
 
+import argparse
+import heapq
+import os
+import random
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from datetime import datetime, timedelta
 from loguru import logger
 
 from repository import get_repository
-from streamlit_adapters import EuromillionsUIAdapter
 
 # Configuration du logging
 logger.remove()
 logger.add(sys.stdout, level="INFO", format="<green>{time:HH:mm:ss}</green> | <level>{message}</level>")
 
+MAIN_COLUMNS = ['n1', 'n2', 'n3', 'n4', 'n5']
+STAR_COLUMNS = ['s1', 's2']
+
+# Adaptateur partagé par tous les backtesters du processus
+_adapter = None
+
+
+def _get_adapter():
+    """
+    Get the shared UI adapter.
+    Imported on first call: the module-level StreamlitAdapters instance (models,
+    database) is then reused instead of building a new adapter per backtester.
+    """
+    global _adapter
+    if _adapter is None:
+        from streamlit_adapters import streamlit_adapters
+        _adapter = streamlit_adapters
+    return _adapter
+
+
+# Rang de gain EuroMillions par (numéros corrects, étoiles correctes)
+_NO_GAIN = "Rien gagné ❌"
+_GAIN_TABLE = {
+    (5, 2): "Rang 1 - JACKPOT! 🎰💰",
+    (5, 1): "Rang 2 - ~100K€ 💎",
+    (5, 0): "Rang 3 - ~10K€ 💰",
+    (4, 2): "Rang 4 - ~1K€ 🎁",
+    (4, 1): "Rang 5 - ~100€ 🎫",
+    (3, 2): "Rang 6 - ~50€ 🎫",
+    (4, 0): "Rang 7 - ~30€ 🎫",
+    (2, 2): "Rang 8 - ~20€ 🎫",
+    (3, 1): "Rang 9 - ~15€ 🎫",
+    (3, 0): "Rang 10 - ~10€ 🎫",
+    (1, 2): "Rang 11 - ~8€ 🎫",
+    (2, 1): "Rang 12 - ~5€ 🎫",
+}
+# Libellés des rangs (0 = Rang 1, ..., 11 = Rang 12, 12 = rien gagné) et identifiant
+# de rang pour chaque code numéros * 3 + étoiles (0-17)
+_RANK_NAMES = list(_GAIN_TABLE.values()) + [_NO_GAIN]
+_RANK_ID_BY_CODE = np.array([
+    _RANK_NAMES.index(_GAIN_TABLE.get(divmod(code, 3), _NO_GAIN)) for code in range(18)
+])
+
+
+def numbers_mask(numbers: List[int]) -> int:
+    """Encode des numéros (1-50 ou 1-12) en masque de bits: le bit n est levé pour le numéro n."""
+    mask = 0
+    for number in numbers:
+        mask |= 1 << int(number)
+    return mask
+
+
+def tickets_one_hot(numbers_per_ticket: List[List[int]], max_number: int) -> np.ndarray:
+    """Matrice (n_tickets, max_number + 1) avec un 1 à la colonne de chaque numéro joué."""
+    matrix = np.zeros((len(numbers_per_ticket), max_number + 1), dtype=np.int32)
+    for i, numbers in enumerate(numbers_per_ticket):
+        matrix[i, numbers] = 1
+    return matrix
+
+
+def draws_one_hot(draws: pd.DataFrame, columns: List[str], max_number: int) -> np.ndarray:
+    """Matrice (n_tirages, max_number + 1) des numéros tirés, remplie en une seule indexation."""
+    numbers = draws[columns].to_numpy(dtype=np.intp)
+    matrix = np.zeros((len(numbers), max_number + 1), dtype=np.int32)
+    matrix[np.arange(len(numbers))[:, None], numbers] = 1
+    return matrix
+
 
 class SeedBacktester:
     """Teste différentes graines pour trouver les meilleures performances."""
@@ -37,16 +109,24 @@ class SeedBacktester:
         self.seeds = seeds_to_test or list(range(1, 101))  # Test 100 graines par défaut
         self.methods = methods_to_test or ["topk", "random", "hybrid", "ensemble"]
         self.repo = get_repository()
-        self.adapter = EuromillionsUIAdapter()
+        self.adapter = _get_adapter()
+        
+        # Tickets déjà générés par (seed, méthode, nombre de tickets, ensemble),
+        # stockés en tuples (numéros, étoiles) pour être réutilisés entre les tests
+        self._tickets_cache: Dict[Tuple[int, str, int, bool], Tuple[Tuple[Tuple[int, ...], Tuple[int, ...]], ...]] = {}
         
     def calculate_match_score(self, predicted: List[int], actual: List[int]) -> int:
         """
         Calcule le score de correspondance entre prédiction et résultat réel.
         
+        Le backtest complet passe par les produits matriciels (voir
+        tickets_one_hot); cette méthode reste pour scorer un ticket isolé.
+        
         Returns:
             Score: nombre de numéros correspondants
         """
-        return len(set(predicted) & set(actual))
+        # bin().count plutôt que int.bit_count(), absent avant Python 3.10
+        return bin(numbers_mask(predicted) & numbers_mask(actual)).count("1")
     
     def calculate_ticket_score(self, ticket: Dict[str, Any], actual_draw: pd.Series) -> Dict[str, int]:
         """
@@ -71,36 +151,54 @@ class SeedBacktester:
         Returns:
             Rang du gain (ex: "Rang 1", "Rang 5", "Rien")
         """
-        if main_matches == 5 and star_matches == 2:
-            return "Rang 1 - JACKPOT! 🎰💰"
-        elif main_matches == 5 and star_matches == 1:
-            return "Rang 2 - ~100K€ 💎"
-        elif main_matches == 5 and star_matches == 0:
-            return "Rang 3 - ~10K€ 💰"
-        elif main_matches == 4 and star_matches == 2:
-            return "Rang 4 - ~1K€ 🎁"
-        elif main_matches == 4 and star_matches == 1:
-            return "Rang 5 - ~100€ 🎫"
-        elif main_matches == 3 and star_matches == 2:
-            return "Rang 6 - ~50€ 🎫"
-        elif main_matches == 4 and star_matches == 0:
-            return "Rang 7 - ~30€ 🎫"
-        elif main_matches == 2 and star_matches == 2:
-            return "Rang 8 - ~20€ 🎫"
-        elif main_matches == 3 and star_matches == 1:
-            return "Rang 9 - ~15€ 🎫"
-        elif main_matches == 3 and star_matches == 0:
-            return "Rang 10 - ~10€ 🎫"
-        elif main_matches == 1 and star_matches == 2:
-            return "Rang 11 - ~8€ 🎫"
-        elif main_matches == 2 and star_matches == 1:
-            return "Rang 12 - ~5€ 🎫"
-        else:
-            return "Rien gagné ❌"
+        return _GAIN_TABLE.get((main_matches, star_matches), _NO_GAIN)
+    
+    def generate_tickets(self, seed: int, method: str, n_tickets: int) -> List[Dict[str, List[int]]]:
+        """
+        Génère (ou relit depuis le cache) les tickets d'une configuration.
+        
+        Args:
+            seed: Graine aléatoire
+            method: Méthode de génération
+            n_tickets: Nombre de tickets à générer
+            
+        Returns:
+            Liste de tickets {'main': [...], 'stars': [...]}
+        """
+        use_ensemble = method == "ensemble"
+        key = (seed, method, n_tickets, use_ensemble)
+        cached = self._tickets_cache.get(key)
+        if cached is None:
+            tickets = self.adapter.suggest_tickets_ui(
+                n=n_tickets,
+                method=method,
+                seed=seed,
+                use_ensemble=use_ensemble
+            )
+            cached = tuple(
+                (tuple(ticket.get('main') or ticket.get('balls', [])), tuple(ticket.get('stars', [])))
+                for ticket in tickets
+            )
+            self._tickets_cache[key] = cached
+        
+        return [{'main': list(main), 'stars': list(stars)} for main, stars in cached]
+    
+    def _prepare_draws(self, test_draws: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convertit les tirages de test en matrices one-hot (numéros, étoiles).
+        
+        Args:
+            test_draws: DataFrame des tirages à tester
+            
+        Returns:
+            Tuple (n_tirages, 51) et (n_tirages, 13) des numéros tirés
+        """
+        return draws_one_hot(test_draws, MAIN_COLUMNS, 50), draws_one_hot(test_draws, STAR_COLUMNS, 12)
     
     def backtest_single_config(self, seed: int, method: str, 
                               test_draws: pd.DataFrame, 
-                              n_tickets: int = 10) -> Dict[str, Any]:
+                              n_tickets: int = 10,
+                              draw_matrices: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Dict[str, Any]:
         """
         Teste une configuration (seed + méthode) sur des tirages historiques.
         
@@ -109,50 +207,45 @@ class SeedBacktester:
             method: Méthode de génération
             test_draws: DataFrame des tirages à tester
             n_tickets: Nombre de tickets à générer
+            draw_matrices: Résultat de _prepare_draws(test_draws), pour ne pas
+                reconvertir les mêmes tirages à chaque configuration
             
         Returns:
             Statistiques de performance
         """
-        total_main_matches = 0
-        total_star_matches = 0
-        total_score = 0
         best_result = {'main': 0, 'stars': 0}
-        wins_by_rank = {f"Rang {i}": 0 for i in range(1, 13)}
-        wins_by_rank["Rien gagné"] = 0
-        
-        for idx, actual_draw in test_draws.iterrows():
-            try:
-                # Générer les tickets avec cette config
-                tickets = self.adapter.suggest_tickets_ui(
-                    n=n_tickets,
-                    method=method,
-                    seed=seed,
-                    use_ensemble=(method == "ensemble")
-                )
-                
-                # Évaluer chaque ticket
-                for ticket in tickets:
-                    score = self.calculate_ticket_score(ticket, actual_draw)
-                    total_main_matches += score['main_matches']
-                    total_star_matches += score['star_matches']
-                    total_score += score['total_score']
-                    
-                    # Meilleur résultat
-                    if (score['main_matches'] > best_result['main'] or 
-                        (score['main_matches'] == best_result['main'] and 
-                         score['star_matches'] > best_result['stars'])):
-                        best_result = {
-                            'main': score['main_matches'],
-                            'stars': score['star_matches']
-                        }
-                    
-                    # Compter les gains
-                    rank = self.get_euromillions_gain(score['main_matches'], score['star_matches'])
-                    wins_by_rank[rank] = wins_by_rank.get(rank, 0) + 1
-                    
-            except Exception as e:
-                logger.warning(f"Erreur pour seed={seed}, method={method}: {e}")
-                continue
+        
+        # Générer les tickets avec cette config: les arguments ne dépendent pas
+        # du tirage testé, une seule génération suffit pour tous les tirages.
+        # En cas d'échec, la configuration est abandonnée sans rien évaluer.
+        try:
+            tickets = self.generate_tickets(seed, method, n_tickets)
+        except Exception as e:
+            logger.warning(f"Erreur de génération pour seed={seed}, method={method}: {e}")
+            return self._empty_result(seed, method, len(test_draws))
+        
+        # Tickets et tirages en matrices one-hot: un seul produit matriciel donne
+        # le nombre de numéros communs pour chaque couple (ticket, tirage)
+        ticket_main = tickets_one_hot([ticket['main'] for ticket in tickets], 50)
+        ticket_stars = tickets_one_hot([ticket['stars'] for ticket in tickets], 12)
+        draw_main, draw_stars = draw_matrices if draw_matrices is not None else self._prepare_draws(test_draws)
+        main_matches = ticket_main @ draw_main.T
+        star_matches = ticket_stars @ draw_stars.T
+        
+        total_main_matches = int(main_matches.sum())
+        total_star_matches = int(star_matches.sum())
+        total_score = total_main_matches * 10 + total_star_matches * 5  # Pondération
+        
+        # Chaque résultat encodé en main * 3 + étoiles (0-17): le meilleur résultat
+        # (numéros d'abord, puis étoiles) est le code maximal, et un histogramme
+        # des codes donne les gains par rang
+        outcome_codes = (main_matches * 3 + star_matches).ravel()
+        if outcome_codes.size:
+            best_main, best_stars = divmod(int(outcome_codes.max()), 3)
+            best_result = {'main': best_main, 'stars': best_stars}
+        
+        rank_counts = np.bincount(_RANK_ID_BY_CODE[outcome_codes], minlength=len(_RANK_NAMES))
+        wins_by_rank = dict(zip(_RANK_NAMES, rank_counts.tolist()))
         
         n_draws_tested = len(test_draws)
         n_total_tickets = n_draws_tested * n_tickets
@@ -172,20 +265,47 @@ class SeedBacktester:
             'wins_by_rank': wins_by_rank
         }
     
+    @staticmethod
+    def _empty_result(seed: int, method: str, n_draws: int) -> Dict[str, Any]:
+        """Statistiques nulles d'une configuration dont les tickets n'ont pas pu être générés."""
+        return {
+            'seed': seed,
+            'method': method,
+            'n_draws_tested': n_draws,
+            'n_tickets_generated': 0,
+            'total_main_matches': 0,
+            'total_star_matches': 0,
+            'total_score': 0,
+            'avg_main_matches': 0,
+            'avg_star_matches': 0,
+            'avg_score': 0,
+            'best_result': {'main': 0, 'stars': 0},
+            'wins_by_rank': dict.fromkeys(_RANK_NAMES, 0)
+        }
+    
     def run_comprehensive_test(self, n_recent_draws: int = 50, 
-                              n_tickets_per_draw: int = 10) -> pd.DataFrame:
+                              n_tickets_per_draw: int = 10,
+                              max_workers: Optional[int] = None,
+                              seeds: Optional[List[int]] = None) -> List[Dict[str, Any]]:
         """
         Lance un test complet sur toutes les combinaisons seed/méthode.
         
+        Les combinaisons sont indépendantes: elles sont réparties sur un pool
+        de processus (un backtester par processus).
+        
         Args:
             n_recent_draws: Nombre de tirages récents à utiliser pour le test
             n_tickets_per_draw: Nombre de tickets à générer par tirage
+            max_workers: Nombre de processus (défaut: nombre de cœurs, 1 = séquentiel)
+            seeds: Graines à tester (défaut: toutes les graines du backtester)
             
         Returns:
-            DataFrame avec les résultats de tous les tests
+            Liste des résultats de tous les tests, dans l'ordre seed/méthode
         """
+        seeds = self.seeds if seeds is None else seeds
+        
         logger.info(f"🚀 Démarrage du backtest complet")
-        logger.info(f"   Seeds à tester: {len(self.seeds)}")
+        logger.info(f"   Seeds à tester: {len(seeds)}")
         logger.info(f"   Méthodes: {', '.join(self.methods)}")
         logger.info(f"   Tirages de test: {n_recent_draws} derniers")
         logger.info(f"   Tickets par tirage: {n_tickets_per_draw}")
@@ -194,80 +314,180 @@ class SeedBacktester:
         all_draws = self.repo.all_draws_df()
         test_draws = all_draws.tail(n_recent_draws)
         
-        logger.info(f"   Date de début: {test_draws.iloc[0]['draw_date']}")
-        logger.info(f"   Date de fin: {test_draws.iloc[-1]['draw_date']}")
+        logger.info(f"   Date de début: {test_draws['draw_date'].iat[0]}")
+        logger.info(f"   Date de fin: {test_draws['draw_date'].iat[-1]}")
         logger.info("")
         
-        results = []
-        total_tests = len(self.seeds) * len(self.methods)
-        current_test = 0
+        # Les tirages de test sont les mêmes pour toutes les configurations
+        draw_matrices = self._prepare_draws(test_draws)
+        
+        configs = [(seed, method) for seed in seeds for method in self.methods]
+        total_tests = len(configs)
+        max_workers = min(max_workers or os.cpu_count() or 1, total_tests)
         
-        for seed in self.seeds:
-            for method in self.methods:
-                current_test += 1
+        if max_workers <= 1:
+            results = []
+            for current_test, (seed, method) in enumerate(configs, 1):
                 logger.info(f"[{current_test}/{total_tests}] Test seed={seed}, method={method}...")
                 
                 result = self.backtest_single_config(
                     seed=seed,
                     method=method,
                     test_draws=test_draws,
-                    n_tickets=n_tickets_per_draw
+                    n_tickets=n_tickets_per_draw,
+                    draw_matrices=draw_matrices
                 )
                 results.append(result)
+        else:
+            logger.info(f"   Processus: {max_workers}")
+            results = [None] * total_tests
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_backtest_worker,
+                initargs=(seeds, self.methods, test_draws, draw_matrices)
+            ) as executor:
+                futures = {
+                    executor.submit(_backtest_worker, seed, method, n_tickets_per_draw): i
+                    for i, (seed, method) in enumerate(configs)
+                }
+                for current_test, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    results[i] = future.result()
+                    seed, method = configs[i]
+                    logger.info(f"[{current_test}/{total_tests}] Test seed={seed}, method={method} terminé")
+        
+        return results
+    
+    def run_two_phase(self, n_recent_draws: int = 50, n_tickets_per_draw: int = 10,
+                      pilot_fraction: float = 0.2, keep: int = 10,
+                      pilot_draws: Optional[int] = None,
+                      max_workers: Optional[int] = None,
+                      sample_seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Recherche en deux phases: pilote sur un échantillon de graines, puis test
+        complet des meilleures graines seulement.
+        
+        La génération des tickets domine le coût d'un test: n'en générer que pour
+        une fraction des graines réduit le travail d'environ 1/pilot_fraction,
+        au prix de pouvoir manquer une bonne graine non échantillonnée.
+        
+        Args:
+            n_recent_draws: Nombre de tirages récents pour la phase complète
+            n_tickets_per_draw: Nombre de tickets à générer par tirage
+            pilot_fraction: Fraction des graines testées pendant le pilote
+            keep: Nombre de graines conservées pour la phase complète
+            pilot_draws: Nombre de tirages du pilote (défaut: n_recent_draws // 3)
+            max_workers: Nombre de processus (voir run_comprehensive_test)
+            sample_seed: Graine de l'échantillonnage, pour un pilote reproductible
+            
+        Returns:
+            Résultats de la phase complète sur les graines retenues
+        """
+        n_pilot_seeds = max(1, int(len(self.seeds) * pilot_fraction))
+        pilot_seeds = random.Random(sample_seed).sample(self.seeds, k=min(n_pilot_seeds, len(self.seeds)))
         
-        # Convertir en DataFrame
-        df_results = pd.DataFrame(results)
+        logger.info(f"🧪 Pilote: {len(pilot_seeds)}/{len(self.seeds)} graines")
+        pilot_results = self.run_comprehensive_test(
+            n_recent_draws=pilot_draws or max(1, n_recent_draws // 3),
+            n_tickets_per_draw=n_tickets_per_draw,
+            max_workers=max_workers,
+            seeds=pilot_seeds
+        )
         
-        # Trier par score moyen décroissant
-        df_results = df_results.sort_values('avg_score', ascending=False)
+        # Meilleur score moyen de chaque graine, toutes méthodes confondues
+        best_by_seed: Dict[int, float] = {}
+        for result in pilot_results:
+            best_by_seed[result['seed']] = max(result['avg_score'], best_by_seed.get(result['seed'], float('-inf')))
+        survivors = heapq.nlargest(keep, best_by_seed, key=best_by_seed.get)
         
-        return df_results
+        logger.info(f"🎯 Graines retenues pour le test complet: {survivors}")
+        return self.run_comprehensive_test(
+            n_recent_draws=n_recent_draws,
+            n_tickets_per_draw=n_tickets_per_draw,
+            max_workers=max_workers,
+            seeds=survivors
+        )
     
-    def display_top_results(self, df_results: pd.DataFrame, top_n: int = 10):
-        """Affiche les meilleurs résultats."""
-        logger.info("")
-        logger.info("=" * 80)
-        logger.info(f"🏆 TOP {top_n} MEILLEURES CONFIGURATIONS")
-        logger.info("=" * 80)
-        
-        for idx, row in df_results.head(top_n).iterrows():
-            logger.info("")
-            logger.info(f"Rang #{idx + 1}")
-            logger.info(f"  • Seed: {row['seed']}")
-            logger.info(f"  • Méthode: {row['method']}")
-            logger.info(f"  • Score moyen: {row['avg_score']:.2f}")
-            logger.info(f"  • Numéros principaux (moy): {row['avg_main_matches']:.2f}/5")
-            logger.info(f"  • Étoiles (moy): {row['avg_star_matches']:.2f}/2")
-            logger.info(f"  • Meilleur résultat: {row['best_result']['main']} numéros + {row['best_result']['stars']} étoiles")
+    def display_top_results(self, results: Union[List[Dict[str, Any]], pd.DataFrame], top_n: int = 10):
+        """Affiche les meilleurs résultats (top_n par score moyen, sans trier le reste)."""
+        if isinstance(results, pd.DataFrame):
+            results = results.to_dict('records')
+        
+        # Rapport construit en mémoire puis écrit en un seul appel au logger
+        lines = ["", "=" * 80, f"🏆 TOP {top_n} MEILLEURES CONFIGURATIONS", "=" * 80]
+        
+        top_results = heapq.nlargest(top_n, results, key=itemgetter('avg_score'))
+        for position, row in enumerate(top_results, 1):
+            lines.append("")
+            lines.append(f"Rang #{position}")
+            lines.append(f"  • Seed: {row['seed']}")
+            lines.append(f"  • Méthode: {row['method']}")
+            lines.append(f"  • Score moyen: {row['avg_score']:.2f}")
+            lines.append(f"  • Numéros principaux (moy): {row['avg_main_matches']:.2f}/5")
+            lines.append(f"  • Étoiles (moy): {row['avg_star_matches']:.2f}/2")
+            lines.append(f"  • Meilleur résultat: {row['best_result']['main']} numéros + {row['best_result']['stars']} étoiles")
             
             # Afficher les gains
             wins = row['wins_by_rank']
-            logger.info(f"  • Gains simulés:")
+            lines.append(f"  • Gains simulés:")
             for rank, count in wins.items():
                 if count > 0 and "Rang" in rank:
-                    logger.info(f"     - {rank}: {count} fois")
+                    lines.append(f"     - {rank}: {count} fois")
         
-        logger.info("")
-        logger.info("=" * 80)
+        lines.append("")
+        lines.append("=" * 80)
+        logger.info("\n".join(lines))
     
-    def export_results(self, df_results: pd.DataFrame, filename: str = "backtest_results.csv"):
-        """Exporte les résultats en CSV."""
+    def export_results(self, results: Union[List[Dict[str, Any]], pd.DataFrame],
+                       filename: str = "backtest_results.csv"):
+        """Exporte les résultats en CSV, triés par score moyen décroissant."""
         output_path = Path("data") / filename
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convertir wins_by_rank en colonnes séparées
-        df_export = df_results.copy()
-        for rank in ["Rang 1 - JACKPOT! 🎰💰", "Rang 2 - ~100K€ 💎", "Rang 3 - ~10K€ 💰"]:
-            df_export[rank] = df_export['wins_by_rank'].apply(lambda x: x.get(rank, 0))
+        # Le DataFrame n'est construit que pour l'export
+        df_export = pd.DataFrame(results).sort_values('avg_score', ascending=False)
+        
+        # Convertir wins_by_rank en colonnes séparées (une seule construction)
+        wins_df = pd.DataFrame(
+            df_export['wins_by_rank'].tolist(), index=df_export.index
+        ).reindex(columns=["Rang 1 - JACKPOT! 🎰💰", "Rang 2 - ~100K€ 💎", "Rang 3 - ~10K€ 💰"], fill_value=0).fillna(0).astype(int)
         
-        df_export.drop(columns=['wins_by_rank', 'best_result'], inplace=True)
+        df_export = pd.concat([df_export.drop(columns=['wins_by_rank', 'best_result']), wins_df], axis=1)
         df_export.to_csv(output_path, index=False)
         
         logger.info(f"📊 Résultats exportés vers: {output_path}")
 
 
+# État d'un processus du pool: backtester et tirages de test, créés une fois par processus
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_backtest_worker(seeds: List[int], methods: List[str], test_draws: pd.DataFrame,
+                          draw_matrices: Tuple[np.ndarray, np.ndarray]) -> None:
+    """Initialise un processus du pool de run_comprehensive_test."""
+    _worker_state['backtester'] = SeedBacktester(seeds_to_test=seeds, methods_to_test=methods)
+    _worker_state['test_draws'] = test_draws
+    _worker_state['draw_matrices'] = draw_matrices
+
+
+def _backtest_worker(seed: int, method: str, n_tickets: int) -> Dict[str, Any]:
+    """Teste une configuration (seed + méthode) dans un processus du pool."""
+    return _worker_state['backtester'].backtest_single_config(
+        seed=seed,
+        method=method,
+        test_draws=_worker_state['test_draws'],
+        n_tickets=n_tickets,
+        draw_matrices=_worker_state['draw_matrices']
+    )
+
+
 def main():
     """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Recherche de la meilleure graine par backtesting")
+    parser.add_argument("--pilot", action="store_true",
+                        help="Pilote sur 20%% des graines, puis test complet des 10 meilleures")
+    args = parser.parse_args()
+    
     logger.info("=" * 80)
     logger.info("🔬 SYSTÈME DE BACKTESTING - RECHERCHE DE LA MEILLEURE GRAINE")
     logger.info("=" * 80)
@@ -284,16 +504,24 @@ def main():
     )
     
     # Lancer le test complet
-    df_results = backtester.run_comprehensive_test(
-        n_recent_draws=30,  # Tester sur les 30 derniers tirages
-        n_tickets_per_draw=10  # 10 tickets par tirage
-    )
+    if args.pilot:
+        results = backtester.run_two_phase(
+            n_recent_draws=30,
+            n_tickets_per_draw=10,
+            pilot_fraction=0.2,
+            keep=10
+        )
+    else:
+        results = backtester.run_comprehensive_test(
+            n_recent_draws=30,  # Tester sur les 30 derniers tirages
+            n_tickets_per_draw=10  # 10 tickets par tirage
+        )
     
     # Afficher les meilleurs résultats
-    backtester.display_top_results(df_results, top_n=10)
+    backtester.display_top_results(results, top_n=10)
     
     # Exporter
-    backtester.export_results(df_results)
+    backtester.export_results(results)
     
     logger.info("")
     logger.info("✅ Backtesting terminé!")
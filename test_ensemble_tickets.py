@@ -10,6 +10,8 @@ import sys
 import traceback
 from pathlib import Path
 
+import numpy as np
+
 # Ajouter le répertoire du projet au path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -51,6 +53,25 @@ def test_ensemble_ticket_generation():
                 
             print(f"✅ {len(tickets)} tickets générés avec succès!")
             
+            # Un seul appel batch: vérifier la forme et les bornes de tous les tickets à la fois
+            balls = np.array([ticket.get('balls', []) for ticket in tickets], dtype=object)
+            stars = np.array([ticket.get('stars', []) for ticket in tickets], dtype=object)
+            
+            if len(tickets) != 3 or balls.shape != (3, 5) or stars.shape != (3, 2):
+                print(f"   ⚠️  Format invalide: numéros {balls.shape}, étoiles {stars.shape} (attendu (3, 5) et (3, 2))")
+                return False
+            
+            balls = balls.astype(int)
+            stars = stars.astype(int)
+            
+            if not ((balls >= 1) & (balls <= 50)).all():
+                print(f"   ⚠️  Numéros hors limite: {balls.tolist()}")
+                return False
+                
+            if not ((stars >= 1) & (stars <= 12)).all():
+                print(f"   ⚠️  Étoiles hors limite: {stars.tolist()}")
+                return False
+            
             # Afficher les tickets générés
             print("\n📋 TICKETS GÉNÉRÉS:")
             print("-" * 30)
@@ -61,24 +82,8 @@ def test_ensemble_ticket_generation():
                 print(f"   ⭐ Étoiles: {ticket.get('stars_str', 'N/A')}")
                 print(f"   📊 Confiance: {ticket.get('base_confidence', 0):.3f}")
                 print(f"   🔧 Méthode: {ticket.get('method', 'N/A')}")
-                
-                # Vérifier la validité du ticket
-                balls = ticket.get('balls', [])
-                stars = ticket.get('stars', [])
-                
-                if len(balls) != 5 or len(stars) != 2:
-                    print(f"   ⚠️  Format invalide: {len(balls)} numéros, {len(stars)} étoiles")
-                    return False
-                    
-                if not all(1 <= b <= 50 for b in balls):
-                    print(f"   ⚠️  Numéros hors limite: {balls}")
-                    return False
-                    
-                if not all(1 <= s <= 12 for s in stars):
-                    print(f"   ⚠️  Étoiles hors limite: {stars}")
-                    return False
-                    
-                print(f"   ✅ Ticket valide")
+            
+            print("\n   ✅ Tickets valides")
             
             print(f"\n🎉 SUCCÈS: Génération de tickets ensemble fonctionnelle!")
             return True
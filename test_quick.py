@@ -16,19 +16,24 @@ print("="*70)
 # 1. Vérifier les données disponibles
 print("\n1️⃣ Vérification des données...")
 repo = get_repository()
-draws_df = repo.all_draws_df()
+# Statistiques agrégées + 5 derniers tirages seulement: pas de lecture de tout l'historique
+stats = repo.get_stats()
+total_draws = stats['total_draws']
 
-if len(draws_df) == 0:
+if total_draws == 0:
     print("❌ Aucun tirage dans la base de données")
     print("   Lancez d'abord: python build_datasets.py")
     exit(1)
 
-print(f"✅ {len(draws_df)} tirages disponibles")
-print(f"   Période: {draws_df['draw_date'].min()} à {draws_df['draw_date'].max()}")
+print(f"✅ {total_draws} tirages disponibles")
+print(f"   Période: {stats['earliest_draw']} à {stats['latest_draw']}")
+
+# recent_draws() renvoie du plus récent au plus ancien
+recent_df = repo.recent_draws(5).iloc[::-1].reset_index(drop=True)
 
 # 2. Tester les collecteurs avec un tirage récent
 print("\n2️⃣ Test des collecteurs avec un tirage récent...")
-recent_draw = draws_df.iloc[-1]
+recent_draw = recent_df.iloc[-1]
 test_date = pd.to_datetime(recent_draw['draw_date'])
 if test_date.hour == 0:
     test_date = test_date.replace(hour=21, minute=5)
@@ -79,11 +84,11 @@ except Exception as e:
 
 # 4. Test enrichissement (petit échantillon)
 print("\n4️⃣ Test d'enrichissement (5 derniers tirages)...")
-sample_df = draws_df.tail(5).copy()
+sample_df = recent_df.copy()
 
 try:
     correlator = MultiSourceCorrelator()
-    enriched_df = correlator.build_enriched_dataset(sample_df)
+    enriched_df = correlator.build_enriched_dataset_batch(sample_df)
     print(f"   ✅ Dataset enrichi: {len(enriched_df)} lignes, {len(enriched_df.columns)} colonnes")
     
     # Afficher un aperçu
@@ -100,10 +105,10 @@ print("\n" + "="*70)
 print("✅ TESTS TERMINÉS")
 print("="*70)
 
-print(f"\n💡 Vous avez {len(draws_df)} tirages dans votre base.")
+print(f"\n💡 Vous avez {total_draws} tirages dans votre base.")
 print("   Pour une analyse complète avec corrélations:")
 print("   1. Cela prendra environ 5-7 secondes par tirage")
-print(f"   2. Temps estimé: ~{len(draws_df) * 6 / 60:.0f} minutes")
+print(f"   2. Temps estimé: ~{total_draws * 6 / 60:.0f} minutes")
 print("   3. Les résultats seront sauvegardés dans data/correlations/")
 print("\n   Commande:")
 print("   python -c \"from correlation_engine import build_and_analyze_enriched_dataset; from repository import get_repository; repo = get_repository(); df = repo.all_draws_df(); build_and_analyze_enriched_dataset(df)\"")
@@ -8,6 +8,16 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Cache HTTP optionnel: les relances rapprochées ne refont pas la requête
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Durée de validité des réponses en cache (secondes)
+_HTTP_CACHE_EXPIRE = 3600
+
 def test_real_scraping():
     """Tester le scraping des vraies données."""
     print('🕷️ Test du scraping réel des données EuroMillions')
@@ -69,7 +79,15 @@ def test_real_scraping():
         
         url = "https://www.national-lottery.co.uk/results/euromillions"
         
-        response = requests.get(url, timeout=10)
+        # Session en cache limitée à ce test: les scrapers ci-dessus restent en direct
+        if REQUESTS_CACHE_AVAILABLE:
+            http = requests_cache.CachedSession(
+                'test_scrape_cache', backend='sqlite', expire_after=_HTTP_CACHE_EXPIRE
+            )
+        else:
+            http = requests
+        
+        response = http.get(url, timeout=10)
         print(f'   Status: {response.status_code}')
         
         if response.status_code == 200:
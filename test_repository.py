@@ -2,9 +2,20 @@
 Test script for the Euromillions repository.
 Demonstrates database operations and data management.
 """
-from repository import get_repository, init_database
+from repository import (
+    get_repository, init_database, compress_html, decompress_html,
+    encode_prize_table, decode_prize_table, parse_prize_tables
+)
+from config import get_settings
 from datetime import datetime
 import json
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
 
 def test_repository():
     """Test the repository functionality."""
@@ -86,5 +97,278 @@ def test_repository():
     
     print("\n✅ Repository test completed successfully!")
 
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Repository on an empty database in a temporary directory."""
+    monkeypatch.setattr(get_settings(), "db_url", f"sqlite:///{tmp_path / 'draws.db'}")
+    repository = get_repository()
+    yield repository
+    repository.close()
+
+
+def make_draw(day, numbers=(7, 15, 23, 31, 45), stars=(3, 8), **extra):
+    """Valid draw dictionary for 2024-01-<day>."""
+    draw = {
+        "draw_id": f"2024-{day:03d}",
+        "draw_date": f"2024-01-{day:02d}",
+        **dict(zip(("n1", "n2", "n3", "n4", "n5"), numbers)),
+        **dict(zip(("s1", "s2"), stars)),
+        "jackpot": 17000000.0,
+    }
+    draw.update(extra)
+    return draw
+
+
+def external_write(repo, *statements):
+    """Run (sql, params) statements on the repository's file through another connection."""
+    conn = sqlite3.connect(repo._db_path_str)
+    try:
+        for sql, params in statements:
+            conn.execute(sql, params)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_upsert_rejects_invalid_draws(repo):
+    """Wrong types, out-of-range numbers and bad dates are counted as errors, not stored."""
+    invalid = [
+        make_draw(1, numbers=(7, 15, None, 31, 45)),
+        make_draw(2, numbers=(7, 15, "23", 31, 45)),
+        make_draw(3, numbers=(7, 15, 23, 31, 51)),
+        make_draw(4, stars=(0, 8)),
+        make_draw(5, stars=(True, 8)),
+        make_draw(6, draw_date="05/01/2024"),
+        make_draw(7, draw_date="2024-02-30"),
+        {"draw_id": "2024-008", "draw_date": "2024-01-08"},
+    ]
+    
+    result = repo.upsert_draws(invalid + [make_draw(9)])
+    
+    assert result == {"inserted": 1, "updated": 0, "errors": len(invalid)}
+    assert repo.all_draws_df()["draw_id"].tolist() == ["2024-009"]
+
+
+def test_upsert_stores_numpy_integers_as_integers(repo):
+    """numpy integers are accepted and read back as numbers."""
+    numbers = np.array([7, 15, 23, 31, 45], dtype=np.int64)
+    repo.upsert_draws([make_draw(1, numbers=tuple(numbers), stars=tuple(np.array([3, 8])))])
+    
+    row = repo.all_draws_df().iloc[0]
+    assert row[["n1", "n2", "n3", "n4", "n5", "s1", "s2"]].tolist() == [7, 15, 23, 31, 45, 3, 8]
+
+
+def test_reads_tolerate_null_and_blob_numbers(repo):
+    """Rows written outside the repository with bad numbers read as NaN instead of failing."""
+    repo.upsert_draws([make_draw(1), make_draw(2)])
+    
+    external_write(
+        repo,
+        ("UPDATE draws SET n3 = NULL WHERE draw_id = '2024-001'", ()),
+        # sqlite3 stores numpy integers as BLOBs
+        ("UPDATE draws SET s1 = ? WHERE draw_id = '2024-002'", (np.int64(3).tobytes(),)),
+    )
+    
+    df = repo.all_draws_df()
+    
+    assert len(df) == 2
+    assert df["n3"].dtype == np.float64 and df["n3"].isna().tolist() == [True, False]
+    assert df["s1"].isna().tolist() == [False, True]
+    assert df["n1"].dtype == np.int16
+    
+    recent = repo.recent_draws(2)
+    assert recent["n3"].isna().tolist() == [False, True]
+    assert recent["n1"].dtype == np.int16
+    
+    streamed = next(repo.iter_draws(chunksize=10))
+    assert streamed["s1"].isna().tolist() == [False, True]
+
+
+def test_upsert_round_trip_keeps_compact_dtypes(repo):
+    """Draws read back sorted by date, with int16 numbers and blobs restored."""
+    prize_table = {"5+2": {"winners": 0, "prize": 17000000}}
+    repo.upsert_draws([
+        make_draw(2, numbers=(1, 2, 3, 4, 50), stars=(1, 12)),
+        make_draw(1, prize_table=prize_table, raw_html="<html>Tirage €</html>"),
+    ])
+    
+    df = repo.all_draws_df(include_blobs=True)
+    
+    assert df["draw_id"].tolist() == ["2024-001", "2024-002"]
+    assert df["draw_date"].dtype == "datetime64[ns]"
+    assert all(df[name].dtype == np.int16 for name in ("n1", "n2", "n3", "n4", "n5", "s1", "s2"))
+    assert df["jackpot"].dtype == np.float64
+    assert df.iloc[1][["n1", "n2", "n3", "n4", "n5", "s1", "s2"]].tolist() == [1, 2, 3, 4, 50, 1, 12]
+    assert parse_prize_tables(df["prize_table_json"]).tolist() == [prize_table, None]
+    assert df["raw_html"].tolist() == ["<html>Tirage €</html>", None]
+    
+    draw = repo.get_draw_by_id("2024-001")
+    assert draw["prize_table"] == prize_table
+    assert draw["raw_html"] == "<html>Tirage €</html>"
+
+
+def test_iter_draws_streams_all_draws_df_in_chunks(repo):
+    """Concatenated chunks equal all_draws_df()."""
+    repo.upsert_draws([make_draw(day) for day in range(1, 6)])
+    
+    chunks = list(repo.iter_draws(chunksize=2))
+    
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), repo.all_draws_df())
+
+
+def test_iter_draws_does_not_block_other_threads(repo):
+    """The shared connection stays usable while an iterator is suspended."""
+    repo.upsert_draws([make_draw(1), make_draw(2)])
+    counts = []
+    worker = threading.Thread(target=lambda: counts.append(repo.count_draws()))
+    
+    iterator = repo.iter_draws(chunksize=1)
+    next(iterator)
+    try:
+        worker.start()
+        worker.join(timeout=5)
+        assert counts == [2]
+    finally:
+        iterator.close()
+        worker.join()
+
+
+def test_recent_draws_and_count_draws(repo):
+    """recent_draws returns the newest draws first; count_draws counts all of them."""
+    repo.upsert_draws([make_draw(day) for day in (3, 1, 2)])
+    
+    assert repo.recent_draws(2)["draw_id"].tolist() == ["2024-003", "2024-002"]
+    assert repo.count_draws() == 3
+
+
+def test_stats_cache_is_invalidated_by_external_writes(repo):
+    """Triggers drop the cached stats whenever another connection changes draws."""
+    repo.upsert_draws([make_draw(1)])
+    assert repo.get_stats()["total_draws"] == 1
+    assert repo._conn.execute("SELECT COUNT(*) FROM meta").fetchone()[0] == 3
+    
+    external_write(repo, (
+        "INSERT INTO draws (draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2) "
+        "VALUES ('ext', '2024-01-05', 1, 2, 3, 4, 5, 1, 2)", ()
+    ))
+    assert repo.count_draws() == 2
+    assert repo.latest_draw_date() == "2024-01-05"
+    
+    external_write(repo, ("UPDATE draws SET draw_date = '2023-12-31' WHERE draw_id = '2024-001'", ()))
+    assert repo.get_stats()["earliest_draw"] == "2023-12-31"
+    
+    external_write(repo, ("DELETE FROM draws WHERE draw_id = 'ext'", ()))
+    stats = repo.get_stats()
+    assert (stats["total_draws"], stats["latest_draw"]) == (1, "2023-12-31")
+
+
+def test_reset_and_load_replaces_all_draws(repo):
+    """Every previous draw is removed and invalid new ones are counted."""
+    repo.upsert_draws([make_draw(1), make_draw(2)])
+    
+    result = repo.reset_and_load([make_draw(3), make_draw(4, numbers=(0, 15, 23, 31, 45))])
+    
+    assert result == {"deleted": 2, "inserted": 1, "errors": 1}
+    assert repo.all_draws_df()["draw_id"].tolist() == ["2024-003"]
+
+
+def test_reset_and_load_is_atomic(repo):
+    """A failing insert leaves the previous draws untouched."""
+    repo.upsert_draws([make_draw(1), make_draw(2)])
+    external_write(repo, (
+        "CREATE TRIGGER fail_on_boom BEFORE INSERT ON draws WHEN NEW.draw_id = 'boom' "
+        "BEGIN SELECT RAISE(ABORT, 'boom'); END", ()
+    ))
+    
+    with pytest.raises(sqlite3.DatabaseError):
+        repo.reset_and_load([make_draw(3), make_draw(4, draw_id="boom")])
+    
+    assert repo.all_draws_df()["draw_id"].tolist() == ["2024-001", "2024-002"]
+    assert repo.count_draws() == 2
+
+
+def test_html_and_prize_table_helpers_round_trip():
+    """Stored values decode back to the original HTML and prize tables."""
+    html = "<html>Tirage €</html>"
+    assert decompress_html(compress_html(html)) == html
+    # Rows written before compression hold plain text or UTF-8 bytes
+    assert decompress_html(html) == html
+    assert decompress_html(html.encode("utf-8")) == html
+    assert compress_html(None) is None and decompress_html(None) is None
+    
+    prize_table = {"5+2": {"winners": 1, "prize": 30000000}, "5+1": {"winners": 2, "prize": 150000.5}}
+    encoded = encode_prize_table(prize_table)
+    assert isinstance(encoded, str)
+    assert decode_prize_table(encoded) == prize_table
+    assert encode_prize_table({}) is None and decode_prize_table(None) is None
+
+
+# Draws table as created by older versions (and by train_modern.py)
+LEGACY_DRAWS_TABLE = """
+    CREATE TABLE draws (
+        draw_id TEXT PRIMARY KEY, draw_date TEXT,
+        n1 INTEGER, n2 INTEGER, n3 INTEGER, n4 INTEGER, n5 INTEGER,
+        s1 INTEGER, s2 INTEGER, jackpot REAL, prize_table_json TEXT, raw_html TEXT
+    )
+"""
+
+
+def test_legacy_schema_is_migrated(repo):
+    """A database without draw_date_i is migrated and its dates backfilled."""
+    external_write(
+        repo,
+        (LEGACY_DRAWS_TABLE, ()),
+        ("INSERT INTO draws (draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2) "
+         "VALUES ('old', '2015-03-06', 1, 2, 3, 4, 5, 1, 2)", ()),
+    )
+    
+    df = repo.all_draws_df()
+    
+    assert df["draw_date"].tolist() == [np.datetime64("2015-03-06")]
+    epoch_day = repo._conn.execute("SELECT draw_date_i FROM draws").fetchone()[0]
+    assert epoch_day == (datetime(2015, 3, 6) - datetime(1970, 1, 1)).days
+
+
+def test_prize_tables_moved_to_blob_are_restored_as_text(repo):
+    """Prize tables left in prize_table_blob are copied back to prize_table_json."""
+    prize_table = {"1": {"winners": 0, "amount": 17000000.0}}
+    external_write(
+        repo,
+        (LEGACY_DRAWS_TABLE, ()),
+        ("ALTER TABLE draws ADD COLUMN prize_table_blob BLOB", ()),
+        ("INSERT INTO draws (draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2, prize_table_blob) "
+         "VALUES ('blob', '2024-01-02', 1, 2, 3, 4, 5, 1, 12, ?)",
+         (json.dumps(prize_table).encode("utf-8"),)),
+    )
+    
+    assert repo.get_draw_by_id("blob")["prize_table"] == prize_table
+    stored = repo._conn.execute(
+        "SELECT prize_table_json, prize_table_blob FROM draws"
+    ).fetchone()
+    assert json.loads(stored[0]) == prize_table
+    assert stored[1] is None
+
+
+def test_recreated_database_file_is_migrated_again(repo):
+    """Deleting and recreating the file in the same process re-runs the migration."""
+    repo.upsert_draws([make_draw(1)])
+    repo.close()
+    Path(repo._db_path_str).unlink()
+    
+    external_write(
+        repo,
+        (LEGACY_DRAWS_TABLE, ()),
+        ("INSERT INTO draws (draw_id, draw_date, n1, n2, n3, n4, n5, s1, s2) "
+         "VALUES ('modern', '2024-01-02', 1, 2, 3, 4, 5, 1, 12)", ()),
+    )
+    
+    fresh = get_repository()
+    try:
+        assert fresh.all_draws_df()["draw_id"].tolist() == ["modern"]
+    finally:
+        fresh.close()
+
+
 if __name__ == "__main__":
     test_repository()
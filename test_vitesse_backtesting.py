@@ -25,7 +25,8 @@ print(f"   - = {len(seeds) * len(methods) * n_draws * n_tickets} tickets à gén
 
 # Importer
 from repository import get_repository
-from streamlit_app import _generate_tickets_fast
+from streamlit_app import _generate_tickets_fast_batch
+import numpy as np
 import train_models
 
 # Charger les données
@@ -38,8 +39,10 @@ print("⚡ Précalcul des probabilités ML...")
 start_precalc = time.time()
 main_proba = train_models.score_balls()
 star_proba = train_models.score_stars()
-main_scores = {i: main_proba[i-1] for i in range(1, 51)}
-star_scores = {i: star_proba[i-1] for i in range(1, 13)}
+# Tableaux numpy (colonne des probabilités des paires (numéro, proba) triées
+# par numéro): pas de conversion dict -> tableau à chaque appel
+main_scores = np.asarray(main_proba, dtype=np.float32)[:, 1]
+star_scores = np.asarray(star_proba, dtype=np.float32)[:, 1]
 precalc_time = time.time() - start_precalc
 print(f"✅ Précalcul terminé en {precalc_time:.2f}s")
 
@@ -52,9 +55,8 @@ for method in methods:
     print(f"\n🎯 {method}:")
     start = time.time()
     
-    for _ in range(n_draws):
-        for seed in seeds:
-            tickets = _generate_tickets_fast(n_tickets, method, seed, main_scores, star_scores)
+    # Un seul appel pour tous les tickets de toutes les graines
+    tickets_by_seed = _generate_tickets_fast_batch(n_draws * n_tickets, method, seeds, main_scores, star_scores)
     
     elapsed = time.time() - start
     total_tickets = len(seeds) * n_draws * n_tickets
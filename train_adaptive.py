@@ -6,9 +6,9 @@ Entraînement adaptatif des modèles EuroMillions avec détection automatique de
 import numpy as np
 import pandas as pd
 from sklearn.model_selection import TimeSeriesSplit
-from sklearn.metrics import log_loss
 import lightgbm as lgb
-import pickle
+from joblib import Parallel, delayed
+import json
 import os
 from datetime import datetime
 from loguru import logger
@@ -50,28 +50,23 @@ def train_adaptive_models(min_rows=300):
     models_dir = "models"
     os.makedirs(models_dir, exist_ok=True)
     
-    # Save main model
-    main_model_path = os.path.join(models_dir, "main_model_adaptive.pkl")
-    with open(main_model_path, 'wb') as f:
-        pickle.dump({
-            'model': main_model,
-            'meta': meta,
-            'cv_score': main_cv_score,
-            'trained_at': datetime.now().isoformat(),
-            'model_type': 'main_adaptive'
-        }, f)
-    
-    # Save star model
-    star_model_path = os.path.join(models_dir, "star_model_adaptive.pkl")
-    with open(star_model_path, 'wb') as f:
-        pickle.dump({
-            'model': star_model,
-            'meta': meta,
-            'cv_score': star_cv_score,
-            'trained_at': datetime.now().isoformat(),
-            'model_type': 'star_adaptive',
-            'max_stars': max_stars
-        }, f)
+    # Texte natif LightGBM + métadonnées JSON à côté
+    trained_at = datetime.now().isoformat()
+    
+    _save_model(main_model, models_dir, "main_model_adaptive", {
+        'meta': meta,
+        'cv_score': main_cv_score,
+        'trained_at': trained_at,
+        'model_type': 'main_adaptive'
+    })
+    
+    _save_model(star_model, models_dir, "star_model_adaptive", {
+        'meta': meta,
+        'cv_score': star_cv_score,
+        'trained_at': trained_at,
+        'model_type': 'star_adaptive',
+        'max_stars': max_stars
+    })
     
     logger.info(f"✅ Models saved successfully!")
     logger.info(f"   📊 Main model CV score: {main_cv_score:.4f}")
@@ -87,71 +82,146 @@ def train_adaptive_models(min_rows=300):
         'max_stars': max_stars
     }
 
+def _save_model(model, models_dir, name, info):
+    """
+    Save a Booster in LightGBM's native text format with a JSON metadata sidecar
+    
+    Reload with lgb.Booster(model_file=...) and json.load on the sidecar.
+    """
+    model.save_model(os.path.join(models_dir, f"{name}.txt"), num_iteration=model.best_iteration)
+    
+    # default=str: dates et entiers numpy des métadonnées
+    with open(os.path.join(models_dir, f"{name}.json"), 'w') as f:
+        json.dump(info, f, indent=2, default=str)
+
+def _binary_log_loss(y_true, proba, eps=1e-15):
+    """
+    Mean binary log loss over all (sample, number) cells, in one numpy pass
+    
+    Same as sklearn's log_loss(y_true.ravel(), proba.ravel()) up to the clipping
+    epsilon, without its input validation and label binarization.
+    """
+    p = np.clip(proba, eps, 1 - eps)
+    return float(-np.mean(np.where(y_true == 1, np.log(p), np.log1p(-p))))
+
+def _train_fold(fold, train_idx, val_idx, bin_reference, sample_rows, sample_labels, X, y, params, model_type, n_splits):
+    """
+    Train and score one time series CV fold, binned with the shared reference Dataset
+    """
+    logger.info(f"Training fold {fold + 1}/{n_splits} for {model_type}")
+    
+    # TimeSeriesSplit produit des plages contiguës: des tranches (vues, sans
+    # copie) remplacent l'indexation par tableau d'indices
+    t0, t1 = train_idx[0], train_idx[-1] + 1
+    v0, v1 = val_idx[0], val_idx[-1] + 1
+    assert np.array_equal(train_idx, np.arange(t0, t1)) and np.array_equal(val_idx, np.arange(v0, v1))
+    
+    X_val, y_val = X[v0:v1], y[v0:v1]
+    
+    # np.nonzero parcourt les lignes dans l'ordre: sample_rows est trié, et les
+    # échantillons d'une plage de tirages forment eux aussi une plage
+    p0, p1 = np.searchsorted(sample_rows, [t0, t1])
+    q0, q1 = np.searchsorted(sample_rows, [v0, v1])
+    
+    # reference: mêmes bornes de bins pour tous les folds, sans les recalculer
+    train_data = lgb.Dataset(
+        X[sample_rows[p0:p1]], label=sample_labels[p0:p1],
+        reference=bin_reference, params={'verbose': -1}
+    )
+    val_data = lgb.Dataset(
+        X[sample_rows[q0:q1]], label=sample_labels[q0:q1],
+        reference=bin_reference, params={'verbose': -1}
+    )
+    
+    model = lgb.train(
+        params,
+        train_data,
+        valid_sets=[val_data],
+        num_boost_round=100,
+        callbacks=[lgb.early_stopping(10), lgb.log_evaluation(0)]
+    )
+    
+    # Softmax (somme = 1) -> probabilité d'apparition de chaque numéro:
+    # multiplier par le nombre de numéros tirés (5 boules ou 2 étoiles)
+    picks_per_draw = (p1 - p0) / (t1 - t0)
+    fold_predictions = np.clip(model.predict(X_val) * picks_per_draw, 0.0, 1.0)
+    
+    # Calculate validation score
+    val_score = _binary_log_loss(y_val, fold_predictions)
+    
+    logger.info(f"Fold {fold + 1} {model_type} log loss: {val_score:.4f}")
+    
+    return model, val_score
+
 def train_model_cv(X, y, model_type, n_splits=5):
     """
     Train model with time series cross-validation
     """
+    # float32 suffit à LightGBM (moitié moins de mémoire à discrétiser),
+    # et les étiquettes ne valent que 0 ou 1
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    y = y.astype(np.int8, copy=False)
+    
     tscv = TimeSeriesSplit(n_splits=n_splits)
     
     cv_scores = []
     best_model = None
     best_score = float('inf')
     
-    for fold, (train_idx, val_idx) in enumerate(tscv.split(X)):
-        logger.info(f"Training fold {fold + 1}/{n_splits} for {model_type}")
-        
-        X_train, X_val = X[train_idx], X[val_idx] 
-        y_train, y_val = y[train_idx], y[val_idx]
-        
-        # LightGBM parameters
-        params = {
-            'objective': 'multiclass' if y.shape[1] > 2 else 'binary',
-            'num_class': y.shape[1] if y.shape[1] > 2 else None,
-            'metric': 'multi_logloss' if y.shape[1] > 2 else 'binary_logloss',
-            'boosting_type': 'gbdt',
-            'num_leaves': 31,
-            'learning_rate': 0.1,
-            'feature_fraction': 0.8,
-            'bagging_fraction': 0.8,
-            'bagging_freq': 5,
-            'verbose': -1,
-            'random_state': 42
-        }
-        
-        # Convert to multi-label format for LightGBM
-        models = []
-        fold_predictions = np.zeros_like(y_val)
-        
-        for class_idx in range(y.shape[1]):
-            # Train binary classifier for each class
-            train_data = lgb.Dataset(X_train, label=y_train[:, class_idx])
-            val_data = lgb.Dataset(X_val, label=y_val[:, class_idx], reference=train_data)
-            
-            binary_params = params.copy()
-            binary_params['objective'] = 'binary'
-            binary_params['metric'] = 'binary_logloss'
-            del binary_params['num_class']
-            
-            model = lgb.train(
-                binary_params,
-                train_data,
-                valid_sets=[val_data],
-                num_boost_round=100,
-                callbacks=[lgb.early_stopping(10), lgb.log_evaluation(0)]
-            )
-            
-            models.append(model)
-            fold_predictions[:, class_idx] = model.predict(X_val)
-        
-        # Calculate validation score
-        val_score = log_loss(y_val.ravel(), fold_predictions.ravel())
+    # Un seul booster multiclasse par fold au lieu d'un modèle binaire par
+    # numéro: chaque tirage est répété une fois par numéro sorti, avec ce
+    # numéro pour étiquette, et les histogrammes sont partagés entre classes
+    sample_rows, sample_labels = np.nonzero(y)
+    
+    # LightGBM parameters
+    params = {
+        'objective': 'multiclass',
+        'num_class': y.shape[1],
+        'metric': 'multi_logloss',
+        'boosting_type': 'gbdt',
+        # GOSS: chaque itération garde les 20% d'échantillons aux plus forts
+        # gradients et 10% des autres (remplace le bagging, incompatible)
+        'data_sample_strategy': 'goss',
+        'top_rate': 0.2,
+        'other_rate': 0.1,
+        'num_leaves': 31,
+        'learning_rate': 0.1,
+        'feature_fraction': 0.8,
+        'verbose': -1,
+        'random_state': 42
+    }
+    
+    folds = list(tscv.split(X))
+    
+    # Bornes des bins calculées une seule fois, sur le préfixe d'entraînement
+    # du premier fold uniquement: TimeSeriesSplit étend la fenêtre, ce préfixe
+    # fait donc partie de l'entraînement de chaque fold et aucun fold ne voit
+    # de bornes issues de tirages postérieurs à ses données d'entraînement
+    first_train_end = np.searchsorted(sample_rows, folds[0][0][-1] + 1)
+    bin_reference = lgb.Dataset(
+        X[sample_rows[:first_train_end]], label=sample_labels[:first_train_end],
+        params={'verbose': -1}
+    ).construct()
+    
+    # Folds indépendants: entraînés en parallèle dans des threads (LightGBM
+    # libère le GIL), qui partagent les bornes de bins de la référence.
+    # Les threads LightGBM sont répartis entre les folds.
+    n_cpus = os.cpu_count() or 1
+    n_jobs = min(n_splits, max(1, n_cpus // 2))
+    params['num_threads'] = max(1, n_cpus // n_jobs)
+    
+    fold_results = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(_train_fold)(fold, train_idx, val_idx, bin_reference, sample_rows, sample_labels,
+                             X, y, params, model_type, n_splits)
+        for fold, (train_idx, val_idx) in enumerate(folds)
+    )
+    
+    for model, val_score in fold_results:
         cv_scores.append(val_score)
         
-        logger.info(f"Fold {fold + 1} {model_type} log loss: {val_score:.4f}")
-        
         if val_score < best_score:
             best_score = val_score
-            best_model = models
+            best_model = model
     
     cv_mean = np.mean(cv_scores)
     cv_std = np.std(cv_scores)
@@ -445,8 +445,8 @@ class EuromillionsTrainer:
         """
         logger.info(f"Generating {k} combinations using {method} method")
         
-        # Set random seed for reproducibility
-        np.random.seed(seed)
+        # Local generator for reproducibility, without touching NumPy's global state
+        rng = np.random.default_rng(seed)
         
         # Get scores
         ball_scores = self.score_balls()
@@ -457,25 +457,26 @@ class EuromillionsTrainer:
         sorted_stars = sorted(star_scores, key=lambda x: x[1], reverse=True)
         
         combinations = []
+        generated_at = datetime.now().isoformat()  # Same instant for the whole batch
         
         for i in range(k):
             if method == "topk":
-                combo = self._generate_topk_combination(sorted_balls, sorted_stars)
+                combo = self._generate_topk_combination(sorted_balls, sorted_stars, rng)
             elif method == "random":
-                combo = self._generate_random_combination(ball_scores, star_scores)
+                combo = self._generate_random_combination(ball_scores, star_scores, rng)
             elif method == "hybrid":
                 # Mix of topk and random based on iteration
                 if i < k // 2:
-                    combo = self._generate_topk_combination(sorted_balls, sorted_stars, top_n=15)
+                    combo = self._generate_topk_combination(sorted_balls, sorted_stars, rng, top_n=15)
                 else:
-                    combo = self._generate_random_combination(ball_scores, star_scores)
+                    combo = self._generate_random_combination(ball_scores, star_scores, rng)
             else:
                 raise ValueError(f"Unknown method: {method}")
             
             # Add metadata
             combo["combination_id"] = i + 1
             combo["method"] = method
-            combo["generated_at"] = datetime.now().isoformat()
+            combo["generated_at"] = generated_at
             
             combinations.append(combo)
         
@@ -485,13 +486,13 @@ class EuromillionsTrainer:
         logger.info(f"Generated {len(combinations)} combinations")
         return combinations
     
-    def _generate_topk_combination(self, sorted_balls: list, sorted_stars: list, 
-                                 top_n: int = None) -> dict:
+    def _generate_topk_combination(self, sorted_balls: list, sorted_stars: list,
+                                 rng: np.random.Generator, top_n: int = None) -> dict:
         """Generate combination using top-k approach."""
         if top_n is None:
             # Pure top-k: take top 5 balls and top 2 stars
-            selected_balls = [ball for ball, _ in sorted_balls[:5]]
-            selected_stars = [star for star, _ in sorted_stars[:2]]
+            selected_ball_pairs = sorted_balls[:5]
+            selected_star_pairs = sorted_stars[:2]
         else:
             # Top-N with some randomness: sample from top N candidates
             ball_candidates = sorted_balls[:min(top_n, len(sorted_balls))]
@@ -501,25 +502,24 @@ class EuromillionsTrainer:
             ball_weights = [prob for _, prob in ball_candidates]
             star_weights = [prob for _, prob in star_candidates]
             
-            ball_indices = np.random.choice(
+            ball_indices = rng.choice(
                 len(ball_candidates), size=5, replace=False, 
                 p=np.array(ball_weights) / sum(ball_weights)
             )
-            star_indices = np.random.choice(
+            star_indices = rng.choice(
                 len(star_candidates), size=2, replace=False,
                 p=np.array(star_weights) / sum(star_weights)
             )
             
-            selected_balls = [ball_candidates[i][0] for i in ball_indices]
-            selected_stars = [star_candidates[i][0] for i in star_indices]
+            selected_ball_pairs = [ball_candidates[i] for i in ball_indices]
+            selected_star_pairs = [star_candidates[i] for i in star_indices]
         
-        # Sort the selections
-        selected_balls.sort()
-        selected_stars.sort()
+        # Sort the selections, keeping each number with its own probability
+        # (no membership scan over all scores)
+        selected_balls, ball_probs = map(list, zip(*sorted(selected_ball_pairs)))
+        selected_stars, star_probs = map(list, zip(*sorted(selected_star_pairs)))
         
         # Calculate combined score
-        ball_probs = [prob for ball, prob in sorted_balls if ball in selected_balls]
-        star_probs = [prob for star, prob in sorted_stars if star in selected_stars]
         combined_score = np.mean(ball_probs + star_probs)
         
         return {
@@ -530,7 +530,8 @@ class EuromillionsTrainer:
             "combined_score": float(combined_score)
         }
     
-    def _generate_random_combination(self, ball_scores: list, star_scores: list) -> dict:
+    def _generate_random_combination(self, ball_scores: list, star_scores: list,
+                                   rng: np.random.Generator) -> dict:
         """Generate combination using weighted random sampling."""
         # Extract probabilities
         ball_probs = [prob for _, prob in ball_scores]
@@ -541,16 +542,18 @@ class EuromillionsTrainer:
         star_weights = np.array(star_probs) / sum(star_probs)
         
         # Sample without replacement
-        ball_indices = np.random.choice(
+        ball_indices = rng.choice(
             50, size=5, replace=False, p=ball_weights
         )
-        star_indices = np.random.choice(
+        star_indices = rng.choice(
             12, size=2, replace=False, p=star_weights
         )
         
-        # Convert to ball/star numbers and sort
-        selected_balls = sorted([int(i + 1) for i in ball_indices])  # Ensure Python int
-        selected_stars = sorted([int(i + 1) for i in star_indices])  # Ensure Python int
+        # Convert to ball/star numbers and sort (in place, tolist() gives Python ints)
+        ball_indices.sort()
+        star_indices.sort()
+        selected_balls = (ball_indices + 1).tolist()
+        selected_stars = (star_indices + 1).tolist()
         
         # Get probabilities for selected numbers
         ball_probs_selected = [ball_scores[ball - 1][1] for ball in selected_balls]
@@ -64,17 +64,15 @@ def train_modern_rules():
         )
     ''')
     
-    # Insérer les données modernes
-    for _, row in modern_df.iterrows():
-        cursor.execute(
-            "INSERT OR REPLACE INTO draws (draw_date, n1, n2, n3, n4, n5, s1, s2, jackpot) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                row['draw_date'].strftime('%Y-%m-%d'),
-                int(row['n1']), int(row['n2']), int(row['n3']), int(row['n4']), int(row['n5']),
-                int(row['s1']), int(row['s2']),
-                0
-            )
-        )
+    # Insérer les données modernes (tuples positionnels, un seul executemany)
+    number_cols = ['n1', 'n2', 'n3', 'n4', 'n5', 's1', 's2']
+    rows_df = modern_df[number_cols].astype(int)
+    rows_df.insert(0, 'draw_date', modern_df['draw_date'].dt.strftime('%Y-%m-%d'))
+    rows_df['jackpot'] = 0
+    cursor.executemany(
+        "INSERT OR REPLACE INTO draws (draw_date, n1, n2, n3, n4, n5, s1, s2, jackpot) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows_df.astype(object).itertuples(index=False, name=None)
+    )
     
     conn.commit()
     conn.close()
@@ -496,9 +496,15 @@ def format_tickets_display(tickets):
     return '\n\n---\n\n'.join(display_lines)
 
 
-def _extract_probabilities(scores: dict, num_range: range) -> np.ndarray:
-    """Extract probabilities from score dictionary handling both tuples and floats."""
+def _extract_probabilities(scores, num_range: range) -> np.ndarray:
+    """Extract probabilities from score dictionary handling both tuples and floats.
+    
+    A numpy array (index 0 = smallest number) is used as is, without a per-number lookup.
+    """
     import numpy as np
+    if isinstance(scores, np.ndarray):
+        # float64: rng.choice vérifie que p somme à 1 avec une tolérance serrée
+        return scores.astype(np.float64, copy=False)
     # Check first element to determine type
     first_val = scores[num_range[0]]
     if isinstance(first_val, tuple):
@@ -506,16 +512,67 @@ def _extract_probabilities(scores: dict, num_range: range) -> np.ndarray:
     else:
         return np.array([scores[i] for i in num_range])
 
-def _generate_hybrid_selection(probs: np.ndarray, top_k: int, select_k: int, nums_range: range) -> list:
-    """Generate hybrid selection: top-K weighted random sampling."""
+def _hybrid_pool(probs: np.ndarray, top_k: int):
+    """Top-K numbers and their normalized probabilities for hybrid sampling."""
     import numpy as np
     top_idx = np.argsort(probs)[-top_k:]
     top_probs = probs[top_idx]
     top_probs_norm = (top_probs / top_probs.sum()).flatten()
     top_nums = (top_idx + 1).flatten()
-    return sorted(np.random.choice(top_nums, size=select_k, replace=False, p=top_probs_norm).tolist())
+    return top_nums, top_probs_norm
+
+def _sample_without_replacement(rng, nums: np.ndarray, probs: np.ndarray, n: int, k: int) -> np.ndarray:
+    """
+    Tire n fois k numéros distincts pondérés par probs, en une seule opération.
+    
+    Astuce Gumbel-top-k: les k plus grandes clés log(p) + Gumbel suivent la même
+    loi qu'un tirage séquentiel pondéré sans remise (rng.choice(replace=False)).
+    
+    Returns:
+        Tableau (n, k) des numéros tirés, triés sur chaque ligne
+    
+    Raises:
+        ValueError: Moins de k numéros de probabilité non nulle (comme rng.choice)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_probs = np.log(probs)
+    # Sinon argpartition renverrait en silence des numéros exclus (clé -inf)
+    if np.count_nonzero(np.isfinite(log_probs)) < k:
+        raise ValueError(f"Impossible de tirer {k} numéros distincts: moins de {k} probabilités non nulles")
+    keys = log_probs + rng.gumbel(size=(n, len(nums)))
+    top_idx = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+    return np.sort(nums[top_idx], axis=1)
+
+def _generate_tickets_from_probs(n: int, method: str, rng, main_probs: np.ndarray,
+                                 star_probs: np.ndarray) -> List[dict]:
+    """
+    Génère n tickets à partir de tableaux de probabilités déjà extraits.
+    
+    Tout ce qui ne dépend pas du ticket (tri, normalisation, top-K) est
+    calculé une seule fois, et les n tickets sont tirés ensemble.
+    """
+    if method == "topk":
+        # Top-K déterministe: le même ticket à chaque tirage
+        main = np.sort(np.argsort(main_probs)[-MAIN_NUMBERS_COUNT:] + 1).tolist()
+        stars = np.sort(np.argsort(star_probs)[-STAR_NUMBERS_COUNT:] + 1).tolist()
+        return [{'main': list(main), 'stars': list(stars)} for _ in range(n)]
+    
+    if method == "random":
+        # Aléatoire pondéré par probabilités
+        main_pool, main_pool_probs = np.arange(MAIN_NUM_MIN, MAIN_NUM_MAX + 1), main_probs
+        star_pool, star_pool_probs = np.arange(STAR_NUM_MIN, STAR_NUM_MAX + 1), star_probs
+    else:
+        # Hybrid selection: top-K weighted random
+        # Note: ensemble/advanced_hybrid use same fast approximation in backtesting
+        main_pool, main_pool_probs = _hybrid_pool(main_probs, HYBRID_TOP_MAIN)
+        star_pool, star_pool_probs = _hybrid_pool(star_probs, HYBRID_TOP_STARS)
+    
+    # Les clés de Gumbel ne demandent pas de probabilités normalisées
+    main = _sample_without_replacement(rng, main_pool, main_pool_probs, n, MAIN_NUMBERS_COUNT)
+    stars = _sample_without_replacement(rng, star_pool, star_pool_probs, n, STAR_NUMBERS_COUNT)
+    return [{'main': m, 'stars': s} for m, s in zip(main.tolist(), stars.tolist())]
 
-def _generate_tickets_fast(n: int, method: str, seed: int, main_scores: dict, star_scores: dict) -> List[dict]:
+def _generate_tickets_fast(n: int, method: str, seed: int, main_scores, star_scores) -> List[dict]:
     """
     Génère des tickets RAPIDEMENT en utilisant des probabilités précalculées.
     Évite le rechargement des modèles ML à chaque appel.
@@ -525,11 +582,33 @@ def _generate_tickets_fast(n: int, method: str, seed: int, main_scores: dict, st
         method: Méthode de génération
         seed: Graine aléatoire
         main_scores: Probabilités précalculées pour les numéros principaux {1:0.12, 2:0.08, ...}
+            ou tableau numpy de 50 probabilités
         star_scores: Probabilités précalculées pour les étoiles {1:0.15, 2:0.09, ...}
+            ou tableau numpy de 12 probabilités
     
     Returns:
         Liste de tickets {main: [1,2,3,4,5], stars: [1,2]}
     """
+    return _generate_tickets_fast_batch(n, method, [seed], main_scores, star_scores)[seed]
+
+def _generate_tickets_fast_batch(n: int, method: str, seeds: List[int], main_scores,
+                                 star_scores) -> Dict[int, List[dict]]:
+    """
+    Génère n tickets pour chaque graine en un seul appel.
+    
+    Les probabilités ne sont extraites et préparées qu'une fois pour toutes
+    les graines.
+    
+    Args:
+        n: Nombre de tickets par graine
+        method: Méthode de génération
+        seeds: Graines aléatoires
+        main_scores: Probabilités des numéros principaux (dict ou tableau numpy)
+        star_scores: Probabilités des étoiles (dict ou tableau numpy)
+    
+    Returns:
+        Tickets {main: [...], stars: [...]} de chaque graine
+    """
     import numpy as np
     
     # Input validation
@@ -538,48 +617,15 @@ def _generate_tickets_fast(n: int, method: str, seed: int, main_scores: dict, st
     if method not in ["topk", "random", "hybrid", "ensemble", "advanced_hybrid"]:
         raise ValueError(f"Unknown method: {method}")
     
-    # Use RandomState for better reproducibility
-    rng = np.random.RandomState(seed)
-    tickets = []
-    
     # Extract probabilities once (optimized)
-    main_nums = list(range(MAIN_NUM_MIN, MAIN_NUM_MAX + 1))
-    star_nums = list(range(STAR_NUM_MIN, STAR_NUM_MAX + 1))
-    main_probs = _extract_probabilities(main_scores, main_nums)
-    star_probs = _extract_probabilities(star_scores, star_nums)
-    
-    for i in range(n):
-        if method == "topk":
-            # Top-K déterministe
-            top_main_idx = np.argsort(main_probs)[-MAIN_NUMBERS_COUNT:]
-            top_star_idx = np.argsort(star_probs)[-STAR_NUMBERS_COUNT:]
-            main = sorted((top_main_idx + 1).tolist())
-            stars = sorted((top_star_idx + 1).tolist())
-        
-        elif method == "random":
-            # Aléatoire pondéré par probabilités
-            main_probs_norm = main_probs / main_probs.sum()
-            star_probs_norm = star_probs / star_probs.sum()
-            main = sorted(rng.choice(main_nums, size=MAIN_NUMBERS_COUNT, replace=False, p=main_probs_norm).tolist())
-            stars = sorted(rng.choice(star_nums, size=STAR_NUMBERS_COUNT, replace=False, p=star_probs_norm).tolist())
-        
-        elif method in ["hybrid", "ensemble", "advanced_hybrid"]:
-            # Hybrid selection: top-K weighted random
-            # Note: ensemble/advanced_hybrid use same fast approximation in backtesting
-            main = _generate_hybrid_selection(main_probs, HYBRID_TOP_MAIN, MAIN_NUMBERS_COUNT, main_nums)
-            stars = _generate_hybrid_selection(star_probs, HYBRID_TOP_STARS, STAR_NUMBERS_COUNT, star_nums)
-        
-        else:
-            # Fallback: uniform random
-            main = sorted(rng.choice(main_nums, size=MAIN_NUMBERS_COUNT, replace=False).tolist())
-            stars = sorted(rng.choice(star_nums, size=STAR_NUMBERS_COUNT, replace=False).tolist())
-        
-        tickets.append({
-            'main': main,
-            'stars': stars
-        })
+    main_probs = _extract_probabilities(main_scores, range(MAIN_NUM_MIN, MAIN_NUM_MAX + 1))
+    star_probs = _extract_probabilities(star_scores, range(STAR_NUM_MIN, STAR_NUM_MAX + 1))
     
-    return tickets
+    # Use RandomState for better reproducibility (un générateur par graine)
+    return {
+        seed: _generate_tickets_from_probs(n, method, np.random.RandomState(seed), main_probs, star_probs)
+        for seed in seeds
+    }
 
 
 def run_backtesting(seeds: List[int], methods: List[str], n_draws: int, n_tickets: int) -> pd.DataFrame:
@@ -1055,10 +1101,16 @@ def main():
     col1, col2, col3 = st.columns(3)
     
     with col1:
+        force_training = st.checkbox(
+            "Forcer le réentraînement",
+            value=False,
+            help="Réentraîne même si aucun nouveau tirage n'a été ajouté depuis le dernier entraînement"
+        )
+        
         if st.button("🏋️ Entraîner (from scratch)", use_container_width=True):
             with st.spinner("Entraînement des modèles en cours..."):
                 try:
-                    result = train_from_scratch()
+                    result = train_from_scratch(force=force_training)
                     
                     if result.get("success", False):
                         st.success(f"✅ {result['message']}")